@@ -5,7 +5,7 @@ Core classes and utilities for data fetching and pipeline management.
 """
 
 from .base_fetcher import BaseDataFetcher
-from .utils import DataValidator, SOURCE_SCHEMAS
+from .utils import DataValidator, SOURCE_SCHEMAS, SourceSchema
 from .date_utils import DateUtils
 from .symbol_processor import SymbolProcessor
 from .config_manager import ConfigurationManager
@@ -15,6 +15,7 @@ __all__ = [
     'BaseDataFetcher',
     'DataValidator',
     'SOURCE_SCHEMAS',
+    'SourceSchema',
     'DateUtils',
     'SymbolProcessor',
     'ConfigurationManager',
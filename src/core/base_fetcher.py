@@ -235,7 +235,8 @@ class BaseDataFetcher(ABC):
             total_rows = len(combined_data)
             date_range = ""
             
-            if 'date' in combined_data.columns:
+            # Parsing every date just for the log line is skipped when INFO is off
+            if 'date' in combined_data.columns and self.logger.isEnabledFor(logging.INFO):
                 try:
                     dates = pd.to_datetime(combined_data['date'])
                     date_range = f" ({dates.min().strftime('%Y-%m-%d')} to {dates.max().strftime('%Y-%m-%d')})"
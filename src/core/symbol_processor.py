@@ -144,6 +144,9 @@ class SymbolProcessor:
         """
         Add default start date if not present.
         
+        Operates in place on the frame returned by _filter_by_source, which
+        is already an independent copy of the caller's symbols.
+        
         Args:
             symbols_df: Input DataFrame
             default_start_date: Default start date string
@@ -151,7 +154,7 @@ class SymbolProcessor:
         Returns:
             DataFrame with default dates added
         """
-        df_with_dates = symbols_df.copy()
+        df_with_dates = symbols_df
         
         # Add default start date if column doesn't exist
         if 'date_series_start' not in df_with_dates.columns:
@@ -186,13 +189,15 @@ class SymbolProcessor:
             self.logger.error(f"Missing required columns for {source_type}: {missing_columns}")
             return pd.DataFrame()
         
-        # Remove rows with missing symbols
-        initial_count = len(symbols_df)
-        validated_df = symbols_df.dropna(subset=['symbol']).copy()
-        dropped_count = initial_count - len(validated_df)
+        # Remove rows with missing symbols (only copy when something is dropped)
+        missing_symbols = symbols_df['symbol'].isna()
+        dropped_count = int(missing_symbols.sum())
         
         if dropped_count > 0:
+            validated_df = symbols_df.loc[~missing_symbols].copy()
             self.logger.warning(f"Dropped {dropped_count} rows with missing symbols")
+        else:
+            validated_df = symbols_df
         
         # Validate date format
         validated_df = self._validate_date_format(validated_df)
@@ -201,7 +206,7 @@ class SymbolProcessor:
     
     def _validate_date_format(self, symbols_df: pd.DataFrame) -> pd.DataFrame:
         """
-        Validate and standardize date format.
+        Validate and standardize date format (in place).
         
         Args:
             symbols_df: Input DataFrame
@@ -209,7 +214,7 @@ class SymbolProcessor:
         Returns:
             DataFrame with validated dates
         """
-        df_validated = symbols_df.copy()
+        df_validated = symbols_df
         
         try:
             # Try to parse dates to validate format
@@ -4,62 +4,65 @@ Utility functions for the data collection pipeline.
 
 import pandas as pd
 import logging
-from typing import Optional, Dict, Any
+from dataclasses import dataclass
+from typing import Optional, Dict, Any, Tuple
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+@dataclass(frozen=True, slots=True)
+class SourceSchema:
+    """Expected long-format structure for a single data source"""
+    required_columns: Tuple[str, ...]
+    description: str
+    date_column: str = 'date'
+    identifier_column: str = 'symbol'
+    numeric_columns: Tuple[str, ...] = ()
+
 # Source-specific schema definitions
-SOURCE_SCHEMAS = {
-    'yahoo': {
-        'required_columns': ['date', 'symbol', 'open', 'high', 'low', 'close', 'volume'],
-        'description': 'Yahoo Finance OHLCV data',
-        'date_column': 'date',
-        'identifier_column': 'symbol'
-    },
-    'fred': {
-        'required_columns': ['date', 'series_id', 'value'],
-        'description': 'FRED economic data',
-        'date_column': 'date',
-        'identifier_column': 'series_id'
-    },
-    'eia': {
-        'required_columns': ['date', 'series_id', 'value'],
-        'description': 'EIA energy data',
-        'date_column': 'date',
-        'identifier_column': 'series_id'
-    },
-    'baker': {
-        'required_columns': ['date', 'symbol', 'metric', 'value'],
-        'description': 'Baker Hughes rig count data',
-        'date_column': 'date',
-        'identifier_column': 'symbol'
-    },
-    'finra': {
-        'required_columns': ['date', 'symbol', 'metric', 'value'],
-        'description': 'FINRA margin statistics',
-        'date_column': 'date',
-        'identifier_column': 'symbol'
-    },
-    'sp500': {
-        'required_columns': ['date', 'symbol', 'metric', 'value'],
-        'description': 'S&P 500 earnings data',
-        'date_column': 'date',
-        'identifier_column': 'symbol'
-    },
-    'usda': {
-        'required_columns': ['date', 'symbol', 'metric', 'value'],
-        'description': 'USDA agricultural data',
-        'date_column': 'date',
-        'identifier_column': 'symbol'
-    },
-    'occ': {
-        'required_columns': ['date', 'symbol', 'metric', 'value'],
-        'description': 'OCC options and futures volume data',
-        'date_column': 'date',
-        'identifier_column': 'symbol'
-    }
+SOURCE_SCHEMAS: Dict[str, SourceSchema] = {
+    'yahoo': SourceSchema(
+        required_columns=('date', 'symbol', 'open', 'high', 'low', 'close', 'volume'),
+        description='Yahoo Finance OHLCV data',
+        numeric_columns=('open', 'high', 'low', 'close', 'volume')
+    ),
+    'fred': SourceSchema(
+        required_columns=('date', 'series_id', 'value'),
+        description='FRED economic data',
+        identifier_column='series_id',
+        numeric_columns=('value',)
+    ),
+    'eia': SourceSchema(
+        required_columns=('date', 'series_id', 'value'),
+        description='EIA energy data',
+        identifier_column='series_id',
+        numeric_columns=('value',)
+    ),
+    'baker': SourceSchema(
+        required_columns=('date', 'symbol', 'metric', 'value'),
+        description='Baker Hughes rig count data',
+        numeric_columns=('value',)
+    ),
+    'finra': SourceSchema(
+        required_columns=('date', 'symbol', 'metric', 'value'),
+        description='FINRA margin statistics',
+        numeric_columns=('value',)
+    ),
+    'sp500': SourceSchema(
+        required_columns=('date', 'symbol', 'metric', 'value'),
+        description='S&P 500 earnings data',
+        numeric_columns=('value',)
+    ),
+    'usda': SourceSchema(
+        required_columns=('date', 'symbol', 'metric', 'value'),
+        description='USDA agricultural data',
+        numeric_columns=('value',)
+    ),
+    'occ': SourceSchema(
+        required_columns=('date', 'symbol', 'metric', 'value'),
+        description='OCC options and futures volume data'
+    )
 }
 
 class DataValidator:
@@ -80,59 +83,44 @@ class DataValidator:
         source_name_lower = source_name.lower()
         
         if df.empty:
-            logger.warning(f"{source_name} DataFrame is empty")
+            logger.warning("%s DataFrame is empty", source_name)
             return False
         
         # Get expected schema for this source
         if source_name_lower not in SOURCE_SCHEMAS:
-            logger.error(f"Unknown source '{source_name}'. Available sources: {list(SOURCE_SCHEMAS.keys())}")
+            logger.error("Unknown source '%s'. Available sources: %s", source_name, list(SOURCE_SCHEMAS.keys()))
             return False
             
         schema = SOURCE_SCHEMAS[source_name_lower]
-        expected_columns = schema['required_columns']
-        description = schema['description']
+        expected_columns = list(schema.required_columns)
+        description = schema.description
         
         # Check if all required columns are present
         missing_columns = [col for col in expected_columns if col not in df.columns]
         if missing_columns:
-            logger.error(f"{source_name} DataFrame missing required columns for {description}. "
-                        f"Missing: {missing_columns}, Expected: {expected_columns}, Got: {df.columns.tolist()}")
+            logger.error("%s DataFrame missing required columns for %s. Missing: %s, Expected: %s, Got: %s",
+                         source_name, description, missing_columns, expected_columns, df.columns.tolist())
             return False
         
-        # Check for null values in critical columns
-        null_counts = df[expected_columns].isnull().sum()
-        if null_counts.any():
-            logger.warning(f"{source_name} DataFrame has null values: {null_counts.to_dict()}")
+        # Check for null values in critical columns (only count columns that have any)
+        null_mask = df[expected_columns].isna().any()
+        if null_mask.any():
+            null_counts = df[null_mask.index[null_mask]].isna().sum()
+            logger.warning("%s DataFrame has null values: %s", source_name, null_counts.to_dict())
         
-        # Source-specific validation
-        if source_name_lower == 'yahoo':
-            # Validate that numeric columns are actually numeric
-            numeric_cols = ['open', 'high', 'low', 'close', 'volume']
-            for col in numeric_cols:
-                if not pd.api.types.is_numeric_dtype(df[col]):
-                    logger.error(f"Yahoo Finance column '{col}' should be numeric")
-                    return False
-                    
-        elif source_name_lower in ['fred', 'eia']:
-            # Validate that value column is numeric
-            if not pd.api.types.is_numeric_dtype(df['value']):
-                logger.error(f"{source_name} 'value' column should be numeric")
-                return False
-                
-        elif source_name_lower in ['baker', 'finra', 'sp500', 'usda']:
-            # Validate that value column is numeric
-            if not pd.api.types.is_numeric_dtype(df['value']):
-                logger.error(f"{source_name} 'value' column should be numeric")
+        # Source-specific validation: numeric columns declared in the schema
+        for col in schema.numeric_columns:
+            if not pd.api.types.is_numeric_dtype(df[col]):
+                logger.error("%s '%s' column should be numeric", source_name, col)
                 return False
         
-        # Validate date column
-        try:
-            pd.to_datetime(df['date'])
-        except Exception:
-            logger.error(f"{source_name} 'date' column contains invalid dates")
+        # Validate date column (nulls are reported above, only unparseable values fail)
+        parsed_dates = pd.to_datetime(df['date'], errors='coerce')
+        if (parsed_dates.isna() & df['date'].notna()).any():
+            logger.error("%s 'date' column contains invalid dates", source_name)
             return False
         
-        logger.info(f"{source_name} DataFrame validation passed for {description}. Shape: {df.shape}")
+        logger.info("%s DataFrame validation passed for %s. Shape: %s", source_name, description, df.shape)
         return True
 
 # Legacy functions for backward compatibility
@@ -142,11 +130,11 @@ def load_symbols_csv(file_path: str) -> pd.DataFrame:
     Consider using SymbolManager.load_symbols_from_db() instead.
     """
     logger.warning("Using legacy CSV loading. Consider switching to database-based symbol loading.")
-    logger.info(f"Loading symbols from {file_path}")
+    logger.info("Loading symbols from %s", file_path)
     try:
         df = pd.read_csv(file_path)
-        logger.info(f"Successfully loaded {len(df)} symbols")
+        logger.info("Successfully loaded %d symbols", len(df))
         return df
     except Exception as e:
-        logger.error(f"Error loading symbols CSV: {str(e)}")
+        logger.error("Error loading symbols CSV: %s", e)
         raise 
\ No newline at end of file
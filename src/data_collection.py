@@ -6,8 +6,11 @@ to parquet files without any transformation or standardization.
 """
 
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 from datetime import datetime
 import logging
+import shutil
 from typing import Dict, Optional
 import sys
 from pathlib import Path
@@ -35,6 +38,7 @@ class RawDataCollector:
     def __init__(self, raw_path: str = 'data/raw'):
         self.raw_path = Path(raw_path)
         self.raw_path.mkdir(parents=True, exist_ok=True)
+        self._created_dirs = set()
         
     def save_raw_data(self, source: str, data: pd.DataFrame) -> Optional[Path]:
         """Save raw data from a source to timestamped parquet file"""
@@ -42,21 +46,25 @@ class RawDataCollector:
             logger.warning(f"No data to save for {source}")
             return None
         
-        # Create source-specific directory
+        # Create source-specific directory (once per collector)
         source_dir = self.raw_path / source
-        source_dir.mkdir(parents=True, exist_ok=True)
+        if source_dir not in self._created_dirs:
+            source_dir.mkdir(parents=True, exist_ok=True)
+            self._created_dirs.add(source_dir)
         
         # Generate filename with timestamp
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
         filename = f"{source}_{timestamp}.parquet"
         filepath = source_dir / filename
         
-        # Save raw data as-is
-        data.to_parquet(filepath, index=False, compression='snappy')
+        # Save raw data as-is: convert to Arrow once and write a single encoded file
+        table = pa.Table.from_pandas(data, preserve_index=False)
+        pq.write_table(table, filepath, compression='zstd',
+                       use_dictionary=True, row_group_size=100_000)
         
-        # Also save as 'latest' for easy access
+        # Also save as 'latest' for easy access (byte copy, no second encode)
         latest_path = source_dir / f"{source}_latest.parquet"
-        data.to_parquet(latest_path, index=False, compression='snappy')
+        shutil.copyfile(filepath, latest_path)
         
         logger.info(f"Saved {source} data: {len(data):,} rows to {filepath}")
         return filepath
@@ -67,6 +75,7 @@ class DataCollectionPipeline:
     def __init__(self, allowed_sources: list = None):
         self.collector = RawDataCollector()
         self.allowed_sources = [src.lower() for src in allowed_sources] if allowed_sources else None
+        self._symbols_cache: Optional[pd.DataFrame] = None
         
         if self.allowed_sources:
             logger.info(f"🎯 Source filtering enabled: {', '.join(self.allowed_sources)}")
@@ -88,6 +97,10 @@ class DataCollectionPipeline:
         # Basic stats
         logger.info(f"✅ {source_name.upper()}: {len(df):,} rows collected")
         
+        # The remaining stats need a full pass over the data; skip them when INFO is off
+        if not logger.isEnabledFor(logging.INFO):
+            return
+        
         # Date range if date column exists
         if 'date' in df.columns:
             df_dates = pd.to_datetime(df['date'])
@@ -98,18 +111,29 @@ class DataCollectionPipeline:
         logger.info(f"   📊 Columns: {', '.join(df.columns[:10])}")
     
     def _load_symbols_from_csv(self) -> pd.DataFrame:
-        """Load symbols from CSV file"""
+        """Load symbols from CSV file (read once per pipeline)"""
+        if self._symbols_cache is not None:
+            return self._symbols_cache
+        
         symbols_path = Path("data/symbols.csv")
         if not symbols_path.exists():
             raise Exception("data/symbols.csv not found. Please create this file with symbol data.")
         
         df = pd.read_csv(symbols_path)
         logger.info(f"Loaded {len(df)} symbols from data/symbols.csv")
+        self._symbols_cache = df
         return df
     
-    def _prepare_symbols_for_source(self, symbols_df: pd.DataFrame, source: str) -> pd.DataFrame:
-        """Filter symbols for a specific source"""
-        source_symbols = symbols_df[symbols_df['source'].str.lower() == source.lower()].copy()
+    def _group_symbols_by_source(self, symbols_df: pd.DataFrame) -> Dict[str, pd.DataFrame]:
+        """Split symbols into per-source frames with a single lower-casing pass"""
+        if symbols_df.empty:
+            return {}
+        source_lower = symbols_df['source'].str.lower()
+        return {source: group for source, group in symbols_df.groupby(source_lower, sort=False)}
+    
+    def _prepare_symbols_for_source(self, symbols_by_source: Dict[str, pd.DataFrame], source: str) -> pd.DataFrame:
+        """Get the symbols for a specific source"""
+        source_symbols = symbols_by_source.get(source.lower(), pd.DataFrame())
         
         if source_symbols.empty:
             logger.info(f"No symbols found for source: {source}")
@@ -119,6 +143,7 @@ class DataCollectionPipeline:
     def collect_symbol_based_data(self, symbols_df: pd.DataFrame) -> Dict[str, pd.DataFrame]:
         """Collect data from sources that use symbol lists"""
         results = {}
+        symbols_by_source = self._group_symbols_by_source(symbols_df)
         
         # Yahoo Finance
         if self._is_source_allowed('yahoo'):
@@ -126,7 +151,7 @@ class DataCollectionPipeline:
             logger.info("COLLECTING YAHOO FINANCE DATA")
             logger.info("="*50)
             
-            yahoo_symbols = self._prepare_symbols_for_source(symbols_df, 'yahoo')
+            yahoo_symbols = self._prepare_symbols_for_source(symbols_by_source, 'yahoo')
             if not yahoo_symbols.empty:
                 try:
                     logger.info(f"📋 Processing {len(yahoo_symbols)} Yahoo symbols")
@@ -143,7 +168,7 @@ class DataCollectionPipeline:
             logger.info("COLLECTING FRED DATA")
             logger.info("="*50)
             
-            fred_symbols = self._prepare_symbols_for_source(symbols_df, 'fred')
+            fred_symbols = self._prepare_symbols_for_source(symbols_by_source, 'fred')
             if not fred_symbols.empty:
                 try:
                     logger.info(f"📋 Processing {len(fred_symbols)} FRED series")
@@ -160,7 +185,7 @@ class DataCollectionPipeline:
             logger.info("COLLECTING EIA DATA")
             logger.info("="*50)
             
-            eia_symbols = self._prepare_symbols_for_source(symbols_df, 'eia')
+            eia_symbols = self._prepare_symbols_for_source(symbols_by_source, 'eia')
             if not eia_symbols.empty:
                 try:
                     logger.info(f"📋 Processing {len(eia_symbols)} EIA series")
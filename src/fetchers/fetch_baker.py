@@ -239,9 +239,9 @@ class BakerHughesFetcher(BaseDataFetcher):
                 # Check if the date column is already in datetime format
                 sample_date = df['Date'].iloc[0]
                 if isinstance(sample_date, (datetime, date)) or (isinstance(sample_date, str) and '-' in str(sample_date)):
-                    # Date is already in proper format, just convert to date objects
-                    df['Date'] = pd.to_datetime(df['Date']).dt.date
-                    self.logger.info("Date column already in proper format, converted to date objects")
+                    # Date is already in proper format, just normalize to midnight
+                    df['Date'] = pd.to_datetime(df['Date']).dt.normalize()
+                    self.logger.info("Date column already in proper format, normalized to dates")
                 else:
                     # Date is in Excel serial format, convert using utility method
                     df = self.excel_processor.convert_excel_dates(df, date_columns=['Date'])
@@ -5,24 +5,39 @@ Fetches daily options and futures volume data from the OCC website.
 Simplified to use straightforward start_date and end_date parameters.
 """
 
+import numpy as np
 import pandas as pd
 import os
 import time
+import asyncio
 import calendar
 from datetime import datetime, date
 from dateutil.relativedelta import relativedelta
-from typing import Optional, List, Dict
+from typing import Optional, List, Dict, Tuple
 from io import StringIO
+from concurrent.futures import ThreadPoolExecutor
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException, WebDriverException
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
 from webdriver_manager.chrome import ChromeDriverManager
 
 from ..core.base_fetcher import BaseDataFetcher
 from ..utils.transform_utils import DataTransformUtils
+from ..utils.web_scraping_utils import HIDE_WEBDRIVER_SCRIPT, WebDriverPool, block_page_resources
+
+
+OCC_VOLUME_COLUMNS = ["date", "OCC_Options_Equity_Volume", "OCC_Options_Index_Volume",
+                      "OCC_Options_Debt_Volume", "OCC_Futures_Total_Volume", "OCC_Total_Volume"]
+OCC_FUTURES_COLUMNS = ["date", "OCC_Futures_Equity_Volume", "OCC_Futures_Index_Volume"]
+
+# Fixed categories so frames from different months concatenate without
+# falling back to object dtype
+OCC_METRIC_DTYPE = pd.CategoricalDtype(OCC_VOLUME_COLUMNS[1:] + OCC_FUTURES_COLUMNS[1:])
+OCC_SYMBOL_DTYPE = pd.CategoricalDtype(["OCC"])
 
 
 class OCCDailyDataFetcher(BaseDataFetcher):
@@ -31,21 +46,36 @@ class OCCDailyDataFetcher(BaseDataFetcher):
     Simplified to fetch data for date ranges specified by start_date and end_date.
     """
     
-    def __init__(self, download_dir: str = "data/raw/occ"):
-        """Initialize OCC fetcher."""
+    def __init__(self, download_dir: str = "data/raw/occ", driver_path: Optional[str] = None):
+        """
+        Initialize OCC fetcher.
+        
+        Args:
+            download_dir: Directory for monthly and combined output files
+            driver_path: Path to an already-installed chromedriver; resolved
+                with ChromeDriverManager on first use if None
+        """
         super().__init__("occ")
         
         self.data_transformer = DataTransformUtils()
         self.download_dir = download_dir
         os.makedirs(self.download_dir, exist_ok=True)
         
-        # Create year subdirectories structure
-        self._setup_year_directories()
+        # Partition directories are created on first write
+        self._partition_dirs_created = set()
+        
+        # Combined snapshots sit beside the partitioned months; pyarrow skips
+        # '_'-prefixed directories, so read_parquet(download_dir) only sees months
+        self.snapshot_dir = os.path.join(self.download_dir, "_snapshots")
+        
+        # Completed months already loaded or scraped in this process
+        self._month_cache: Dict[Tuple[int, int], pd.DataFrame] = {}
         
         # OCC configuration
         self.base_url = "https://www.theocc.com/market-data/market-data-reports/volume-and-open-interest/historical-volume-statistics"
         self.sleep_time = 0.3
         self.data_load_wait = 1.0
+        self.first_available_date = date(2008, 1, 1)
         
         # Chrome options
         self.chrome_options = Options()
@@ -61,52 +91,112 @@ class OCCDailyDataFetcher(BaseDataFetcher):
         self.chrome_options.add_argument('--user-agent=Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36')
         
         self.driver = None
-    
-    def _setup_year_directories(self):
-        """Create year subdirectories for organized storage."""
-        # Create directories for years 2008-2025 (OCC data range)
-        for year in range(2008, 2026):
-            year_dir = os.path.join(self.download_dir, str(year))
-            os.makedirs(year_dir, exist_ok=True)
+        self.driver_path = driver_path
     
     def _get_month_file_path(self, year: int, month: int) -> str:
-        """Get the file path for a specific year-month combination."""
-        year_dir = os.path.join(self.download_dir, str(year))
-        filename = f"{year}_{month:02d}.csv"
-        return os.path.join(year_dir, filename)
+        """
+        Get the file path for a specific year-month combination.
+        
+        Months are Hive-partitioned (year=YYYY/month=MM/data.parquet) so a
+        month can be dropped by removing its directory and pyarrow can prune
+        partitions when reading with filters.
+        """
+        return os.path.join(self.download_dir, f"year={year}", f"month={month:02d}", "data.parquet")
     
     def _save_month_data(self, data: pd.DataFrame, year: int, month: int) -> bool:
-        """Save month data to CSV file."""
+        """Save month data to a snappy-compressed parquet file."""
         try:
             filepath = self._get_month_file_path(year, month)
-            data.to_csv(filepath, index=False)
+            if (year, month) not in self._partition_dirs_created:
+                os.makedirs(os.path.dirname(filepath), exist_ok=True)
+                self._partition_dirs_created.add((year, month))
+            data.to_parquet(filepath, compression='snappy', index=False)
             self.logger.info(f"💾 Saved {len(data)} records to {filepath}")
             return True
         except Exception as e:
             self.logger.error(f"Error saving month data: {str(e)}")
             return False
     
-    def fetch_data(self, start_date: date, end_date: date) -> pd.DataFrame:
+    def _month_end(self, year: int, month: int) -> date:
+        """Last calendar day of a month."""
+        return date(year, month, calendar.monthrange(year, month)[1])
+    
+    def month_available(self, year: int, month: int) -> bool:
+        """
+        Cheap check for whether a month can have OCC data, without a browser.
+        
+        Args:
+            year: Year
+            month: Month (1-12)
+            
+        Returns:
+            False for months before OCC's published history or in the future
+        """
+        month_start = date(year, month, 1)
+        return self.first_available_date <= month_start <= datetime.now().date()
+    
+    def _load_cached_month(self, year: int, month: int,
+                           columns: Optional[List[str]] = None) -> Optional[pd.DataFrame]:
+        """
+        Return a month's long-format data without scraping, if it is cached.
+        
+        The per-month parquet files double as an on-disk cache. A file only
+        counts if it was written after the month ended; files saved mid-month
+        hold partial data and are refetched.
+        
+        Args:
+            year: Year
+            month: Month (1-12)
+            columns: Only load these columns (all if None)
+            
+        Returns:
+            Cached DataFrame, or None if the month has to be fetched
+        """
+        key = (year, month)
+        if key in self._month_cache:
+            data = self._month_cache[key]
+            return data[columns] if columns else data
+        
+        filepath = self._get_month_file_path(year, month)
+        try:
+            written = date.fromtimestamp(os.stat(filepath).st_mtime)
+        except FileNotFoundError:
+            return None
+        if written <= self._month_end(year, month):
+            return None
+        
+        try:
+            data = pd.read_parquet(filepath, columns=columns)
+        except Exception as e:
+            self.logger.warning(f"Ignoring unreadable cache file {filepath}: {str(e)}")
+            return None
+        
+        # Only full frames go in the in-process cache
+        if not columns:
+            self._month_cache[key] = data
+        return data
+    
+    def fetch_data(self, start_date: date, end_date: date,
+                   columns: Optional[List[str]] = None) -> pd.DataFrame:
         """
         Fetch OCC data for date range.
         
         Args:
             start_date: Start date (will fetch from beginning of that month)
             end_date: End date (will fetch through end of that month)
+            columns: Only return these columns (all if None); cached months
+                are read with parquet column projection
             
         Returns:
             DataFrame with columns: date, symbol, metric, value
         """
-        # Generate list of year-month tuples to fetch
-        months_to_fetch = []
-        current = date(start_date.year, start_date.month, 1)
-        end = date(end_date.year, end_date.month, 1)
-        
-        while current <= end:
-            # Don't fetch future months
-            if current <= datetime.now().date():
-                months_to_fetch.append((current.year, current.month))
-            current += relativedelta(months=1)
+        # Generate list of year-month tuples to fetch, clipped to OCC's history
+        # and the current month (same bounds as month_available)
+        first = max(np.datetime64(start_date, 'M'), np.datetime64(self.first_available_date, 'M'))
+        last = min(np.datetime64(end_date, 'M'), np.datetime64(datetime.now().date(), 'M'))
+        month_numbers = np.arange(first, last + 1).astype('int64')  # months since 1970-01
+        months_to_fetch = list(zip((month_numbers // 12 + 1970).tolist(),
+                                   (month_numbers % 12 + 1).tolist()))
         
         if not months_to_fetch:
             self.logger.warning("No valid months to fetch")
@@ -114,32 +204,60 @@ class OCCDailyDataFetcher(BaseDataFetcher):
         
         self.logger.info(f"Fetching {len(months_to_fetch)} months: {months_to_fetch[0]} to {months_to_fetch[-1]}")
         
-        # Fetch all months
+        # Fetch all months, reusing one browser session (started only if a
+        # month actually has to be scraped)
         all_data = []
-        for year, month in months_to_fetch:
-            month_name = calendar.month_name[month]
-            self.logger.info(f"Fetching {month_name} {year}")
-            
-            month_data = self.extract_month_data_single(year, month)
-            if month_data:
-                long_format_data = self.convert_to_long_format([month_data])
+        owns_driver = False
+        
+        try:
+            for year, month in months_to_fetch:
+                month_name = calendar.month_name[month]
                 
-                # Save to file
-                long_format_data.to_csv(f"data/raw/occ/{year}/{year}_{month:02d}.csv", index=False)
+                cached = self._load_cached_month(year, month, columns)
+                if cached is not None:
+                    self.logger.info(f"Using cached data for {month_name} {year}")
+                    all_data.append(cached)
+                    continue
                 
-                # Append to all_data
-                all_data.append(long_format_data)
-            
-            time.sleep(1.0)  # Be nice to the server
+                self.logger.info(f"Fetching {month_name} {year}")
+                if self.driver is None:
+                    self.start_driver()
+                    owns_driver = True
+                
+                month_data = self.extract_month_data_single(year, month)
+                if month_data:
+                    long_format_data = self.convert_to_long_format([month_data])
+                    if long_format_data.empty:
+                        # Nothing to save, and an empty file would be cached as final
+                        time.sleep(1.0)
+                        continue
+                    
+                    # Save to file
+                    self._save_month_data(long_format_data, year, month)
+                    if datetime.now().date() > self._month_end(year, month):
+                        self._month_cache[(year, month)] = long_format_data
+                    
+                    # Append to all_data
+                    all_data.append(long_format_data[columns] if columns else long_format_data)
+                
+                time.sleep(1.0)  # Be nice to the server
+        finally:
+            if owns_driver:
+                self.close_driver()
         
         if all_data:
             combined_df = pd.concat(all_data, ignore_index=True)
             self.logger.info(f"✅ Fetched {len(combined_df)} records")
             
             # Save to file
+            # The month range keeps concurrent fetches of different ranges from
+            # overwriting each other's snapshot within the same second
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"occ_{timestamp}.parquet"
-            filepath = os.path.join(self.download_dir, filename)
+            (first_year, first_month), (last_year, last_month) = months_to_fetch[0], months_to_fetch[-1]
+            month_range = f"{first_year}{first_month:02d}-{last_year}{last_month:02d}"
+            filename = f"occ_{month_range}_{timestamp}.parquet"
+            os.makedirs(self.snapshot_dir, exist_ok=True)
+            filepath = os.path.join(self.snapshot_dir, filename)
             combined_df.to_parquet(filepath, index=False)
             self.logger.info(f"💾 Saved to {filepath}")
             
@@ -149,43 +267,125 @@ class OCCDailyDataFetcher(BaseDataFetcher):
             return pd.DataFrame()
     
     def extract_month_data_single(self, year: int, month: int) -> Optional[Dict]:
-        """Extract data for a single month."""
+        """Extract data for a single month, reusing the running driver if there is one."""
+        owns_driver = self.driver is None
         try:
-            self.start_driver()
+            if owns_driver:
+                self.start_driver()
             result = self.extract_month_data(year, month)
             return result
         except Exception as e:
             self.logger.error(f"Error extracting {year}-{month}: {str(e)}")
             return None
         finally:
-            try:
-                self.close_driver()
-            except:
-                pass
+            if owns_driver:
+                try:
+                    self.close_driver()
+                except WebDriverException:
+                    pass
     
     def start_driver(self):
         """Start Chrome driver."""
-        service = Service(ChromeDriverManager().install())
-        self.driver = webdriver.Chrome(service=service, options=self.chrome_options)
-        self.driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
-        self.driver.maximize_window()
+        self.driver = self._create_driver()
+    
+    def resolve_driver_path(self) -> str:
+        """
+        Install (or find) chromedriver once and remember its path.
+        
+        Call this before creating drivers from several threads so they don't
+        race on ChromeDriverManager's cache; the path can be handed to other
+        fetchers through driver_path.
+        
+        Returns:
+            Path to the chromedriver executable
+        """
+        if self.driver_path is None:
+            self.driver_path = ChromeDriverManager().install()
+        return self.driver_path
+    
+    def _create_driver(self) -> webdriver.Chrome:
+        """Create a configured Chrome driver."""
+        service = Service(self.resolve_driver_path())
+        driver = webdriver.Chrome(service=service, options=self.chrome_options)
+        driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {"source": HIDE_WEBDRIVER_SCRIPT})
+        block_page_resources(driver, self.logger)
+        driver.maximize_window()
+        return driver
+    
+    async def extract_months_async(self, months: List[Tuple[int, int]],
+                                   max_concurrency: int = 4) -> List[Optional[Dict]]:
+        """
+        Extract several months concurrently, each on its own pooled driver.
+        
+        Args:
+            months: List of (year, month) tuples
+            max_concurrency: Maximum number of browsers used at once
+            
+        Returns:
+            Month data dicts (None for failures), in the same order as months
+        """
+        if not months:
+            return []
+        
+        workers = min(max_concurrency, len(months))
+        loop = asyncio.get_running_loop()
+        # Resolve chromedriver before the pool starts drivers in parallel
+        try:
+            await loop.run_in_executor(None, self.resolve_driver_path)
+        except Exception as e:
+            self.logger.error(f"Could not install chromedriver: {str(e)}")
+            return [None] * len(months)
+        semaphore = asyncio.Semaphore(workers)
+        
+        def extract_with_pool(pool: WebDriverPool, year: int, month: int) -> Optional[Dict]:
+            driver = None
+            try:
+                # A driver that fails to start only fails this month
+                driver = pool.acquire()
+                return self.extract_month_data(year, month, driver=driver)
+            except Exception as e:
+                self.logger.error(f"Error extracting {year}-{month}: {str(e)}")
+                return None
+            finally:
+                if driver is not None:
+                    pool.release(driver)
+        
+        with WebDriverPool(self._create_driver, size=workers, logger_name=self.logger.name) as pool, \
+                ThreadPoolExecutor(max_workers=workers) as executor:
+            
+            async def probe(year: int, month: int) -> Optional[Dict]:
+                async with semaphore:
+                    return await loop.run_in_executor(executor, extract_with_pool, pool, year, month)
+            
+            results = await asyncio.gather(*(probe(year, month) for year, month in months),
+                                           return_exceptions=True)
+        
+        for (year, month), result in zip(months, results):
+            if isinstance(result, BaseException):
+                self.logger.error(f"Error extracting {year}-{month}: {str(result)}")
+        return [None if isinstance(result, BaseException) else result for result in results]
     
     def close_driver(self):
         """Close Chrome driver."""
         if self.driver:
-            self.driver.quit()
+            try:
+                self.driver.quit()
+            finally:
+                self.driver = None
     
-    def extract_month_data(self, year: int, month: int) -> Optional[Dict]:
-        """Extract data for a specific month from OCC website."""
+    def extract_month_data(self, year: int, month: int,
+                           driver: Optional[webdriver.Chrome] = None) -> Optional[Dict]:
+        """Extract data for a specific month from OCC website (uses self.driver unless one is given)."""
+        driver = driver or self.driver
         try:
             # Navigate to page
-            self.driver.get(self.base_url)
+            driver.get(self.base_url)
             time.sleep(self.sleep_time)
             
-            wait = WebDriverWait(self.driver, 10)
+            wait = WebDriverWait(driver, 10)
             
             # Click Daily Statistics radio button
-            radio_buttons = self.driver.find_elements(By.XPATH, "//input[@type='radio']")
+            radio_buttons = driver.find_elements(By.XPATH, "//input[@type='radio']")
             daily_radio = None
             for radio in radio_buttons:
                 if radio.get_attribute('value') == 'D':
@@ -195,12 +395,12 @@ class OCCDailyDataFetcher(BaseDataFetcher):
             if not daily_radio:
                 return None
             
-            self.driver.execute_script("arguments[0].click();", daily_radio)
+            driver.execute_script("arguments[0].click();", daily_radio)
             time.sleep(self.sleep_time)
             
             # Click date picker
             date_input = wait.until(EC.element_to_be_clickable((By.XPATH, "//input[@name='report_date']")))
-            self.driver.execute_script("arguments[0].click();", date_input)
+            driver.execute_script("arguments[0].click();", date_input)
             time.sleep(self.sleep_time)
             
             # Navigate to year/month
@@ -208,7 +408,7 @@ class OCCDailyDataFetcher(BaseDataFetcher):
                 year_month_btn = wait.until(EC.element_to_be_clickable((By.XPATH, "//span[contains(@class, 'month__year_btn')]")))
                 year_month_btn.click()
                 time.sleep(self.sleep_time)
-            except:
+            except (TimeoutException, WebDriverException):
                 pass
             
             # Select year
@@ -216,7 +416,7 @@ class OCCDailyDataFetcher(BaseDataFetcher):
                 year_element = wait.until(EC.element_to_be_clickable((By.XPATH, f"//span[contains(@class, 'year') and text()='{year}']")))
                 year_element.click()
                 time.sleep(self.sleep_time)
-            except:
+            except (TimeoutException, WebDriverException):
                 pass
             
             # Select month
@@ -228,37 +428,32 @@ class OCCDailyDataFetcher(BaseDataFetcher):
                 month_element = wait.until(EC.element_to_be_clickable((By.XPATH, f"//span[contains(@class, 'month') and text()='{month_name}']")))
                 month_element.click()
                 time.sleep(self.sleep_time)
-            except:
+            except (TimeoutException, WebDriverException):
                 pass
             
             # Click View button
             view_button = wait.until(EC.element_to_be_clickable((By.XPATH, "//a[contains(@class, 'marketData-inputBtn') and text()='View']")))
-            self.driver.execute_script("arguments[0].click();", view_button)
-            time.sleep(self.data_load_wait)
+            driver.execute_script("arguments[0].click();", view_button)
             
-            # Extract tables
-            tables = self.driver.find_elements(By.TAG_NAME, "table")
+            # Continue as soon as both volume tables are rendered
+            try:
+                WebDriverWait(driver, max(10, self.data_load_wait)).until(
+                    lambda d: len(d.find_elements(By.TAG_NAME, "table")) >= 2
+                )
+            except TimeoutException:
+                self.logger.warning(f"Timed out waiting for tables for {year}-{month}")
+                return None
+            
+            # Extract tables from a single page snapshot
+            tables = self._read_tables(driver.page_source)
             if len(tables) >= 2:
-                extracted_data = {
+                return {
                     'year': year,
                     'month': month,
-                    'month_name': month_name
+                    'month_name': month_name,
+                    'occ_contract_volume': tables[0],
+                    'futures_contract_volume': tables[1]
                 }
-                
-                # Extract table data
-                for i, table in enumerate(tables[:2]):
-                    try:
-                        table_html = table.get_attribute('outerHTML')
-                        df = pd.read_html(StringIO(table_html))[0]
-                        
-                        if i == 0:
-                            extracted_data['occ_contract_volume'] = df.to_dict('records')
-                        elif i == 1:
-                            extracted_data['futures_contract_volume'] = df.to_dict('records')
-                    except Exception as e:
-                        self.logger.warning(f"Error extracting table {i}: {str(e)}")
-                
-                return extracted_data
             else:
                 return None
                 
@@ -266,54 +461,69 @@ class OCCDailyDataFetcher(BaseDataFetcher):
             self.logger.error(f"Error extracting {year}-{month}: {str(e)}")
             return None
     
+    def _read_tables(self, html: str) -> List[pd.DataFrame]:
+        """Parse all HTML tables in a page, preferring the lxml parser."""
+        try:
+            return pd.read_html(StringIO(html), flavor='lxml')
+        except ImportError:
+            return pd.read_html(StringIO(html))
+        except ValueError:
+            # No tables found
+            return []
+    
     def convert_to_long_format(self, month_data_list: List[Dict]) -> pd.DataFrame:
         """Convert to long format: date, symbol, metric, value."""
-        long_data = []
+        long_frames = []
         
         for month_data in month_data_list:
             year = month_data['year']
             month = month_data['month']
             
             if 'occ_contract_volume' in month_data:
+                # Tables are DataFrames (records from older callers are also accepted)
                 occ_df = pd.DataFrame(month_data['occ_contract_volume'])
+                occ_df.columns = OCC_VOLUME_COLUMNS
                 
                 # Handle futures data if present
                 if 'futures_contract_volume' in month_data:
                     futures_df = pd.DataFrame(month_data['futures_contract_volume'])
                     futures_df = futures_df.iloc[:, :3].copy()
-                    
-                    # Set column names
-                    occ_df.columns = ["date", "OCC_Options_Equity_Volume", "OCC_Options_Index_Volume", 
-                                     "OCC_Options_Debt_Volume", "OCC_Futures_Total_Volume", "OCC_Total_Volume"]
-                    futures_df.columns = ["date", "OCC_Futures_Equity_Volume", "OCC_Futures_Index_Volume"]
+                    futures_df.columns = OCC_FUTURES_COLUMNS
                     
                     # Merge
                     merged_df = pd.merge(occ_df, futures_df, on='date', how='outer')
                 else:
                     merged_df = occ_df
                 
-                # Filter daily data only
-                daily_mask = merged_df['date'].astype(str).str.match(r'^\d{1,2}/\d{1,2}$')
-                daily_df = merged_df[daily_mask].copy()
+                # Filter daily data only; extract always yields both columns,
+                # even when the table has no M/D rows
+                month_day = merged_df['date'].astype(str).str.extract(r'^(\d{1,2})/(\d{1,2})$')
+                daily_mask = month_day[0].notna()
+                if not daily_mask.any():
+                    self.logger.warning(f"No daily rows found for {year}-{month:02d}")
+                    continue
+                daily_df = merged_df[daily_mask].reset_index(drop=True)
+                month_day = month_day[daily_mask].reset_index(drop=True)
                 
-                # Fix dates
-                daily_df['date'] = daily_df['date'].apply(
-                    lambda x: f"{year}-{x.split('/')[0].zfill(2)}-{x.split('/')[1].zfill(2)}"
+                # Fix dates (M/D -> YYYY-MM-DD)
+                daily_df['date'] = (
+                    f"{year}-" + month_day[0].str.zfill(2) + "-" + month_day[1].str.zfill(2)
                 )
                 
-                # Convert to long format
-                for _, row in daily_df.iterrows():
-                    date_val = row['date']
-                    for col in daily_df.columns:
-                        if col != 'date':
-                            long_data.append({
-                                'date': date_val,
-                                'symbol': 'OCC',
-                                'metric': col,
-                                'value': float(row[col]) if pd.notna(row[col]) else None
-                            })
+                # Convert to long format, keeping all metrics for a day together
+                long_df = daily_df.melt(
+                    id_vars=['date'], var_name='metric', value_name='value', ignore_index=False
+                ).sort_index(kind='stable').reset_index(drop=True)
+                long_df['value'] = long_df['value'].astype('float64')
+                # Low-cardinality labels are stored as categoricals
+                long_df['metric'] = long_df['metric'].astype(OCC_METRIC_DTYPE)
+                long_df.insert(1, 'symbol', pd.Categorical(['OCC'] * len(long_df), dtype=OCC_SYMBOL_DTYPE))
+                long_frames.append(long_df)
+        
+        if not long_frames:
+            return pd.DataFrame()
         
-        return pd.DataFrame(long_data)
+        return pd.concat(long_frames, ignore_index=True)
     
     # Methods required by BaseDataFetcher
     def get_single_series(self, identifier: str, start_date: datetime, end_date: datetime) -> pd.DataFrame:
@@ -322,9 +532,8 @@ class OCCDailyDataFetcher(BaseDataFetcher):
     
     def fetch_batch(self) -> pd.DataFrame:
         """Fetch full historical data."""
-        start_date = date(2008, 1, 1)
         end_date = datetime.now().date()
-        return self.fetch_data(start_date, end_date)
+        return self.fetch_data(self.first_available_date, end_date)
 
 
 def fetch_occ() -> pd.DataFrame:
@@ -394,7 +394,7 @@ class SP500Fetcher(BaseDataFetcher):
             df_combined = df_combined[df_combined['metric'].isin(keep_symbols)]
             
             # Add symbol column with SILVERBLATT_ prefix
-            df_combined['symbol'] = 'SILVERBLATT_' + df_combined['metric']
+            df_combined['symbol'] = 'SILVERBLATT_' + df_combined['metric'].astype(str)
             
             # Standardize column order using utility method
             df_combined = self.data_transformer.standardize_column_order(
@@ -4,13 +4,14 @@ Bristol Gate Specialized Utilities
 Specialized utility classes for web scraping, file handling, Excel processing, and data transformation.
 """
 
-from .web_scraping_utils import WebScrapingUtils
+from .web_scraping_utils import WebScrapingUtils, WebDriverPool
 from .file_download_utils import FileDownloadUtils
 from .excel_processing_utils import ExcelProcessingUtils
 from .transform_utils import DataTransformUtils
 
 __all__ = [
     'WebScrapingUtils',
+    'WebDriverPool',
     'FileDownloadUtils',
     'ExcelProcessingUtils',
     'DataTransformUtils'
@@ -7,13 +7,43 @@ download directories, waiting for downloads, and finding downloaded files.
 Part of the src_pipeline refactoring to eliminate code duplication.
 """
 
+import asyncio
 import os
+import shutil
+import sys
 import time
 import logging
 import requests
 from pathlib import Path
-from typing import List, Optional, Dict, Any
-from urllib.parse import urlparse, unquote
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Dict, Any, Callable, Tuple
+from urllib.parse import unquote
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    from inotify_simple import INotify, flags as inotify_flags
+except ImportError:  # Optional dependency; polling is used without it
+    INotify = None
+    inotify_flags = None
+
+try:
+    import aiohttp
+    import aiofiles
+except ImportError:  # Optional dependencies; async downloads fall back to threads
+    aiohttp = None
+    aiofiles = None
+
+# Default headers for direct HTTP downloads
+DEFAULT_DOWNLOAD_HEADERS = {
+    "User-Agent": ("Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+                   "AppleWebKit/537.36 (KHTML, like Gecko) "
+                   "Chrome/112.0.0.0 Safari/537.36")
+}
+
+# Polling starts fast and backs off toward the caller's check interval
+INITIAL_POLL_INTERVAL = 0.05
+POLL_BACKOFF_FACTOR = 1.5
 
 
 class FileDownloadUtils:
@@ -38,6 +68,22 @@ class FileDownloadUtils:
         """
         self.logger = logging.getLogger(logger_name or "file_download_utils")
         self.download_dir = download_dir
+        self._session: Optional[requests.Session] = None
+        self._session_pool_size = 0
+        self._listing_cache: Dict[Tuple[str, int, bool], List[str]] = {}
+    
+    def __enter__(self) -> 'FileDownloadUtils':
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+    
+    def close(self) -> None:
+        """Close the shared HTTP session and release pooled connections."""
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+            self._session_pool_size = 0
     
     def ensure_directory_exists(self, directory_path: str) -> str:
         """
@@ -55,43 +101,68 @@ class FileDownloadUtils:
             os.makedirs(abs_path, exist_ok=True)
             self.logger.info(f"Created directory: {abs_path}")
         else:
-            self.logger.debug(f"Directory already exists: {abs_path}")
+            self.logger.debug("Directory already exists: %s", abs_path)
             
         return abs_path
     
     def find_excel_files(self, directory: str, 
-                        include_xlsb: bool = True) -> List[str]:
+                        include_xlsb: bool = True,
+                        refresh: bool = False) -> List[str]:
         """
         Find Excel files in a directory.
         
+        Listings are cached per directory and reused while the directory's
+        modification time is unchanged.
+        
         Args:
             directory: Directory to search
             include_xlsb: Whether to include .xlsb files
+            refresh: Bypass the listing cache and rescan the directory
             
         Returns:
             List of Excel file paths
         """
-        if not os.path.exists(directory):
+        try:
+            dir_mtime = os.stat(directory).st_mtime_ns
+        except FileNotFoundError:
             self.logger.warning(f"Directory does not exist: {directory}")
             return []
         
-        extensions = ['.xlsx', '.xls']
-        if include_xlsb:
-            extensions.append('.xlsb')
+        cache_key = (os.path.abspath(directory), dir_mtime, include_xlsb)
+        if not refresh and cache_key in self._listing_cache:
+            return list(self._listing_cache[cache_key])
+        
+        extensions = ('.xlsx', '.xls') + (('.xlsb',) if include_xlsb else ())
         
         excel_files = []
         try:
-            for filename in os.listdir(directory):
-                if any(filename.lower().endswith(ext) for ext in extensions):
-                    excel_files.append(os.path.join(directory, filename))
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if (entry.is_file(follow_symlinks=False)
+                            and entry.name.lower().endswith(extensions)):
+                        excel_files.append(entry.path)
             
-            self.logger.debug(f"Found {len(excel_files)} Excel files in {directory}")
-            return excel_files
+            self.logger.debug("Found %d Excel files in %s", len(excel_files), directory)
+            self._invalidate_listing_cache(directory)
+            self._listing_cache[cache_key] = excel_files
+            return list(excel_files)
             
         except Exception as e:
             self.logger.error(f"Error finding Excel files: {e}")
             return []
     
+    def _invalidate_listing_cache(self, directory: str) -> None:
+        """
+        Drop cached listings for a directory.
+        
+        Args:
+            directory: Directory whose listings should be forgotten
+        """
+        abs_dir = os.path.abspath(directory)
+        for key in list(self._listing_cache):
+            if key[0] == abs_dir:
+                self._listing_cache.pop(key, None)
+    
     def get_most_recent_file(self, file_paths: List[str]) -> Optional[str]:
         """
         Get the most recently created/modified file from a list.
@@ -107,7 +178,7 @@ class FileDownloadUtils:
         
         try:
             most_recent = max(file_paths, key=os.path.getctime)
-            self.logger.debug(f"Most recent file: {most_recent}")
+            self.logger.debug("Most recent file: %s", most_recent)
             return most_recent
             
         except Exception as e:
@@ -126,7 +197,8 @@ class FileDownloadUtils:
             directory: Directory to monitor
             expected_filename: Expected filename (if known)
             timeout_seconds: Maximum time to wait
-            check_interval: How often to check (seconds)
+            check_interval: Maximum time between checks (seconds); polling
+                starts at INITIAL_POLL_INTERVAL and backs off to this
             
         Returns:
             Path to the downloaded file, or None if timeout
@@ -134,56 +206,75 @@ class FileDownloadUtils:
         self.logger.info(f"Waiting for download in {directory}...")
         
         start_time = time.time()
-        initial_files = set(os.listdir(directory)) if os.path.exists(directory) else set()
+        initial_files = set(self._scan_entries(directory))
+        
+        if self._inotify_available(directory):
+            def is_downloaded(name: str) -> bool:
+                if name in initial_files or not self._is_completed_download(name):
+                    return False
+                return expected_filename is None or name == expected_filename
+            
+            file_path = self._wait_inotify(directory, is_downloaded, timeout_seconds)
+            if file_path:
+                self.logger.info(f"File downloaded: {file_path}")
+                return file_path
+            self.logger.warning(f"Download timeout after {timeout_seconds} seconds")
+            return None
         
+        interval = INITIAL_POLL_INTERVAL
         while time.time() - start_time < timeout_seconds:
-            time.sleep(check_interval)
+            time.sleep(interval)
+            interval = min(interval * POLL_BACKOFF_FACTOR, check_interval)
             
             if not os.path.exists(directory):
                 continue
             
-            current_files = set(os.listdir(directory))
-            new_files = current_files - initial_files
+            current_entries = self._scan_entries(directory)
             
             # Filter out temporary download files
             completed_files = [
-                f for f in new_files 
-                if not f.endswith('.crdownload') 
-                and not f.endswith('.tmp')
-                and not f.startswith('.')
+                entry for name, entry in current_entries.items()
+                if name not in initial_files
+                and not name.endswith('.crdownload') 
+                and not name.endswith('.tmp')
+                and not name.startswith('.')
             ]
             
             if expected_filename:
                 # Look for specific filename
-                if expected_filename in completed_files:
+                if any(entry.name == expected_filename for entry in completed_files):
                     file_path = os.path.join(directory, expected_filename)
                     self.logger.info(f"Expected file downloaded: {file_path}")
                     return file_path
             else:
                 # Look for any new completed file
                 if completed_files:
-                    # Get the most recent one
-                    file_paths = [os.path.join(directory, f) for f in completed_files]
-                    most_recent = self.get_most_recent_file(file_paths)
-                    if most_recent:
-                        self.logger.info(f"File downloaded: {most_recent}")
-                        return most_recent
+                    # Get the most recent one (DirEntry caches its stat result)
+                    try:
+                        most_recent = max(completed_files, key=lambda e: e.stat().st_ctime).path
+                    except OSError as e:
+                        self.logger.debug("Could not stat new files: %s", e)
+                        continue
+                    self.logger.info(f"File downloaded: {most_recent}")
+                    return most_recent
             
             elapsed = time.time() - start_time
-            self.logger.debug(f"Still waiting for download... ({elapsed:.1f}s)")
+            self.logger.debug("Still waiting for download... (%.1fs)", elapsed)
         
         self.logger.warning(f"Download timeout after {timeout_seconds} seconds")
         return None
     
     def wait_for_excel_download(self,
                                directory: str, 
-                               timeout_seconds: int = 60) -> Optional[str]:
+                               timeout_seconds: int = 60,
+                               check_interval: float = 2.0) -> Optional[str]:
         """
         Wait specifically for an Excel file to be downloaded.
         
         Args:
             directory: Directory to monitor
             timeout_seconds: Maximum time to wait
+            check_interval: Maximum time between checks (seconds)
             
         Returns:
             Path to the downloaded Excel file, or None if timeout
@@ -191,12 +282,28 @@ class FileDownloadUtils:
         self.logger.info("Waiting for Excel file download...")
         
         start_time = time.time()
-        initial_excel_files = set(self.find_excel_files(directory))
+        # Always rescan here: the listing cache is keyed on the directory mtime,
+        # which can miss a file that lands within the same timestamp tick
+        initial_excel_files = set(self.find_excel_files(directory, refresh=True))
+        
+        if self._inotify_available(directory):
+            def is_new_excel(name: str) -> bool:
+                return (name.lower().endswith(('.xlsx', '.xls', '.xlsb'))
+                        and os.path.join(directory, name) not in initial_excel_files)
+            
+            file_path = self._wait_inotify(directory, is_new_excel, timeout_seconds)
+            if file_path:
+                self.logger.info(f"Excel file downloaded: {file_path}")
+                return file_path
+            self.logger.warning(f"Excel download timeout after {timeout_seconds} seconds")
+            return None
         
+        interval = INITIAL_POLL_INTERVAL
         while time.time() - start_time < timeout_seconds:
-            time.sleep(2.0)
+            time.sleep(interval)
+            interval = min(interval * POLL_BACKOFF_FACTOR, check_interval)
             
-            current_excel_files = set(self.find_excel_files(directory))
+            current_excel_files = set(self.find_excel_files(directory, refresh=True))
             new_excel_files = current_excel_files - initial_excel_files
             
             if new_excel_files:
@@ -208,7 +315,7 @@ class FileDownloadUtils:
             
             elapsed = time.time() - start_time
             if elapsed % 10 == 0:  # Log every 10 seconds
-                self.logger.debug(f"Still waiting for Excel download... ({elapsed:.0f}s)")
+                self.logger.debug("Still waiting for Excel download... (%.0fs)", elapsed)
         
         self.logger.warning(f"Excel download timeout after {timeout_seconds} seconds")
         return None
@@ -246,7 +353,8 @@ class FileDownloadUtils:
             timeout_seconds=timeout
         )
     
-    def _wait_for_file_with_extension(self, directory: str, extension: str, timeout: int) -> Optional[str]:
+    def _wait_for_file_with_extension(self, directory: str, extension: str, timeout: int,
+                                      check_interval: float = 2.0) -> Optional[str]:
         """
         Wait for any file with the specified extension to be downloaded.
         
@@ -254,38 +362,42 @@ class FileDownloadUtils:
             directory: Directory to monitor
             extension: File extension to look for (e.g., '.xlsx')
             timeout: Timeout in seconds
+            check_interval: Maximum time between checks (seconds)
             
         Returns:
             Path to downloaded file, or None if timeout
         """
-        import time
-        
         self.logger.info(f"Waiting for file with extension {extension} in {directory}...")
         
+        ext_lower = extension.lower()
+        temp_suffixes = ('.crdownload', '.tmp')
+        
         start_time = time.time()
-        initial_files = set()
+        initial_files = self._scan_names(directory, ext_lower)
         
-        if os.path.exists(directory):
-            initial_files = set([
-                f for f in os.listdir(directory) 
-                if f.lower().endswith(extension.lower())
-            ])
+        if self._inotify_available(directory):
+            def is_new_with_extension(name: str) -> bool:
+                return (name.lower().endswith(ext_lower)
+                        and name not in initial_files
+                        and self._is_completed_download(name))
+            
+            file_path = self._wait_inotify(directory, is_new_with_extension, timeout)
+            if file_path:
+                self.logger.info(f"File with extension {extension} downloaded: {file_path}")
+                return file_path
+            self.logger.warning(f"File download timeout after {timeout} seconds")
+            return None
         
+        interval = INITIAL_POLL_INTERVAL
         while time.time() - start_time < timeout:
-            time.sleep(2.0)
+            time.sleep(interval)
+            interval = min(interval * POLL_BACKOFF_FACTOR, check_interval)
             
-            if not os.path.exists(directory):
-                continue
-            
-            current_files = set([
-                f for f in os.listdir(directory) 
-                if f.lower().endswith(extension.lower())
-                and not f.endswith('.crdownload')
-                and not f.endswith('.tmp')
-                and not f.startswith('.')
-            ])
-            
-            new_files = current_files - initial_files
+            # Only the names that appeared since the snapshot need filtering
+            new_files = [
+                f for f in self._scan_names(directory, ext_lower) - initial_files
+                if not f.endswith(temp_suffixes) and not f.startswith('.')
+            ]
             
             if new_files:
                 # Get the most recent file
@@ -297,17 +409,156 @@ class FileDownloadUtils:
             
             elapsed = time.time() - start_time
             if elapsed % 10 == 0:  # Log every 10 seconds
-                self.logger.debug(f"Still waiting for {extension} file... ({elapsed:.0f}s)")
+                self.logger.debug("Still waiting for %s file... (%.0fs)", extension, elapsed)
         
         self.logger.warning(f"File download timeout after {timeout} seconds")
         return None
     
+    @staticmethod
+    def _scan_names(directory: str, ext_lower: str) -> set:
+        """
+        Collect names of regular files with an extension in one scandir pass.
+        
+        Args:
+            directory: Directory to list
+            ext_lower: Lowercase extension to match (e.g., '.xlsx')
+            
+        Returns:
+            Set of matching file names (empty if the directory is missing)
+        """
+        try:
+            with os.scandir(directory) as entries:
+                return {
+                    entry.name for entry in entries
+                    if entry.is_file(follow_symlinks=False)
+                    and entry.name.lower().endswith(ext_lower)
+                }
+        except FileNotFoundError:
+            return set()
+    
+    @staticmethod
+    def _scan_entries(directory: str) -> Dict[str, os.DirEntry]:
+        """
+        List a directory in a single scandir pass.
+        
+        Args:
+            directory: Directory to list
+            
+        Returns:
+            Dictionary mapping file names to DirEntry objects (empty if missing)
+        """
+        try:
+            with os.scandir(directory) as entries:
+                return {entry.name: entry for entry in entries}
+        except FileNotFoundError:
+            return {}
+    
+    @staticmethod
+    def _is_completed_download(filename: str) -> bool:
+        """
+        Check that a filename is not a browser temp/partial download.
+        
+        Args:
+            filename: Name of the file (no directory)
+            
+        Returns:
+            True if the file looks like a finished download
+        """
+        return not (filename.endswith(('.crdownload', '.tmp'))
+                    or filename.startswith('.'))
+    
+    def _inotify_available(self, directory: str) -> bool:
+        """
+        Check whether inotify can be used to watch a directory.
+        
+        Args:
+            directory: Directory to watch
+            
+        Returns:
+            True on Linux with inotify_simple installed and an existing directory
+        """
+        return INotify is not None and sys.platform.startswith('linux') and os.path.isdir(directory)
+    
+    def _wait_inotify(self,
+                      directory: str,
+                      predicate: Callable[[str], bool],
+                      timeout_seconds: float) -> Optional[str]:
+        """
+        Wait for a completed file using kernel inotify events instead of polling.
+        
+        Watches for files closed after writing or moved into the directory
+        (browsers rename .crdownload files on completion) and returns the
+        first one accepted by predicate. The directory is rescanned once after
+        the watch is installed to catch files that arrived just before it.
+        
+        Args:
+            directory: Directory to watch
+            predicate: Filter applied to each event's filename
+            timeout_seconds: Maximum time to wait
+            
+        Returns:
+            Path to the matching file, or None on timeout
+        """
+        deadline = time.monotonic() + timeout_seconds
+        
+        with INotify() as inotify:
+            inotify.add_watch(directory, inotify_flags.CLOSE_WRITE | inotify_flags.MOVED_TO)
+            
+            # A download that finished between the caller's snapshot and
+            # add_watch produces no event, so look once before blocking
+            for name in self._scan_entries(directory):
+                if predicate(name):
+                    return os.path.join(directory, name)
+            
+            while True:
+                remaining_ms = int((deadline - time.monotonic()) * 1000)
+                if remaining_ms <= 0:
+                    return None
+                
+                for event in inotify.read(timeout=remaining_ms):
+                    if event.name and predicate(event.name):
+                        return os.path.join(directory, event.name)
+    
+    def _get_session(self, pool_size: int = 8) -> requests.Session:
+        """
+        Get the shared HTTP session, creating it on first use.
+        
+        Connections are kept alive and reused across downloads, and
+        transient failures (429/5xx) are retried with backoff. The adapter
+        is remounted when a larger connection pool is requested.
+        
+        Args:
+            pool_size: Minimum number of pooled connections per host
+            
+        Returns:
+            Shared requests session
+        """
+        if self._session is None:
+            self._session = requests.Session()
+        
+        if pool_size > self._session_pool_size:
+            retries = Retry(
+                total=3,
+                backoff_factor=0.5,
+                status_forcelist=[429, 500, 502, 503, 504],
+                allowed_methods=frozenset(['GET', 'HEAD'])
+            )
+            adapter = HTTPAdapter(pool_connections=pool_size,
+                                  pool_maxsize=pool_size,
+                                  max_retries=retries)
+            self._session.mount('http://', adapter)
+            self._session.mount('https://', adapter)
+            self._session_pool_size = pool_size
+        
+        return self._session
+    
     def download_file_from_url(self,
                               url: str,
                               download_dir: str,
                               filename: Optional[str] = None,
                               headers: Optional[Dict[str, str]] = None,
-                              timeout: int = 60) -> Optional[str]:
+                              timeout: int = 60,
+                              session: Optional[requests.Session] = None) -> Optional[str]:
         """
         Download a file from a URL.
         
@@ -317,6 +568,7 @@ class FileDownloadUtils:
             filename: Optional custom filename
             headers: Optional HTTP headers
             timeout: Request timeout in seconds
+            session: Optional session to use (defaults to the shared session)
             
         Returns:
             Path to downloaded file, or None if failed
@@ -327,36 +579,30 @@ class FileDownloadUtils:
             
             # Determine filename
             if not filename:
-                parsed_url = urlparse(url)
-                filename = os.path.basename(parsed_url.path)
-                filename = unquote(filename)  # Decode URL encoding
-                
-                if not filename or '.' not in filename:
-                    filename = "downloaded_file"
+                filename = self._filename_from_url(url)
             
             file_path = os.path.join(download_dir, filename)
             
             # Set default headers
             if headers is None:
-                headers = {
-                    "User-Agent": ("Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-                                 "AppleWebKit/537.36 (KHTML, like Gecko) "
-                                 "Chrome/112.0.0.0 Safari/537.36")
-                }
+                headers = DEFAULT_DOWNLOAD_HEADERS
             
             self.logger.info(f"Downloading file from: {url}")
-            self.logger.debug(f"Saving to: {file_path}")
+            self.logger.debug("Saving to: %s", file_path)
             
             # Download the file
-            response = requests.get(url, headers=headers, stream=True, timeout=timeout)
-            response.raise_for_status()
-            
-            # Save the file
-            with open(file_path, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    if chunk:
-                        f.write(chunk)
+            session = session or self._get_session()
+            with session.get(url, headers=headers, stream=True, timeout=timeout) as response:
+                response.raise_for_status()
+                response.raw.decode_content = True
+                
+                # Save the file, copying in C-level 1 MiB blocks
+                with open(file_path, 'wb') as f:
+                    self._preallocate(f, response)
+                    shutil.copyfileobj(response.raw, f, length=1 << 20)
+                    f.truncate()
             
+            self._invalidate_listing_cache(download_dir)
             self.logger.info(f"File downloaded successfully: {file_path}")
             return file_path
             
@@ -364,6 +610,155 @@ class FileDownloadUtils:
             self.logger.error(f"Error downloading file from {url}: {e}")
             return None
     
+    @staticmethod
+    def _filename_from_url(url: str) -> str:
+        """
+        Derive a local filename from the last path segment of a URL.
+        
+        Args:
+            url: URL being downloaded
+            
+        Returns:
+            Decoded filename, or "downloaded_file" if the URL has none
+        """
+        # Last path segment, ignoring scheme/host, query string and fragment
+        path = url.split('?', 1)[0].split('#', 1)[0].split('://', 1)[-1].partition('/')[2]
+        filename = unquote(path.rsplit('/', 1)[-1])  # Decode URL encoding
+        
+        if not filename or '.' not in filename:
+            filename = "downloaded_file"
+        return filename
+    
+    @staticmethod
+    def _preallocate(f, response: requests.Response) -> None:
+        """
+        Reserve disk space for a download when its size is known up front.
+        
+        Skipped for compressed responses, whose Content-Length is the
+        encoded size rather than the size written to disk.
+        
+        Args:
+            f: Open binary file object
+            response: Streaming response being saved
+        """
+        if not hasattr(os, 'posix_fallocate') or response.headers.get('Content-Encoding'):
+            return
+        
+        try:
+            content_length = int(response.headers.get('Content-Length', 0))
+            if content_length > 0:
+                os.posix_fallocate(f.fileno(), 0, content_length)
+        except (ValueError, OSError):
+            pass
+    
+    def download_files(self,
+                       items: List[Tuple[str, Optional[str]]],
+                       download_dir: str,
+                       headers: Optional[Dict[str, str]] = None,
+                       max_workers: int = 8,
+                       timeout: int = 60) -> List[Optional[str]]:
+        """
+        Download several files concurrently over a shared connection pool.
+        
+        Args:
+            items: List of (url, filename) tuples; filename may be None
+            download_dir: Directory to save files
+            headers: Optional HTTP headers applied to every request
+            max_workers: Maximum number of concurrent downloads
+            timeout: Request timeout in seconds
+            
+        Returns:
+            List of downloaded file paths (None for failures), in input order
+        """
+        if not items:
+            return []
+        
+        workers = max(1, min(max_workers, len(items)))
+        session = self._get_session(pool_size=workers)
+        self.ensure_directory_exists(download_dir)
+        
+        self.logger.info(f"Downloading {len(items)} files with {workers} workers")
+        
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(
+                lambda item: self.download_file_from_url(
+                    item[0], download_dir, filename=item[1],
+                    headers=headers, timeout=timeout, session=session
+                ),
+                items
+            ))
+        
+        succeeded = sum(1 for path in results if path)
+        self.logger.info(f"Downloaded {succeeded}/{len(items)} files")
+        return results
+    
+    async def async_download_files(self,
+                                   items: List[Tuple[str, Optional[str]]],
+                                   download_dir: str,
+                                   headers: Optional[Dict[str, str]] = None,
+                                   concurrency: int = 16,
+                                   timeout: int = 60) -> List[Optional[str]]:
+        """
+        Download many files concurrently on the event loop.
+        
+        Uses aiohttp and aiofiles when installed; otherwise runs
+        download_files in a worker thread.
+        
+        Args:
+            items: List of (url, filename) tuples; filename may be None
+            download_dir: Directory to save files
+            headers: Optional HTTP headers applied to every request
+            concurrency: Maximum number of requests in flight
+            timeout: Total timeout per request in seconds
+            
+        Returns:
+            List of downloaded file paths (None for failures), in input order
+        """
+        if not items:
+            return []
+        
+        concurrency = max(1, concurrency)
+        
+        if aiohttp is None or aiofiles is None:
+            self.logger.debug("aiohttp/aiofiles not installed, using thread pool downloads")
+            return await asyncio.to_thread(
+                self.download_files, items, download_dir,
+                headers=headers, max_workers=concurrency, timeout=timeout
+            )
+        
+        self.ensure_directory_exists(download_dir)
+        headers = headers if headers is not None else DEFAULT_DOWNLOAD_HEADERS
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        async def download_one(session, url: str, filename: Optional[str]) -> Optional[str]:
+            file_path = os.path.join(download_dir, filename or self._filename_from_url(url))
+            try:
+                async with semaphore:
+                    async with session.get(url, headers=headers) as response:
+                        response.raise_for_status()
+                        async with aiofiles.open(file_path, 'wb') as f:
+                            async for chunk in response.content.iter_chunked(256 * 1024):
+                                await f.write(chunk)
+                self.logger.debug("File downloaded successfully: %s", file_path)
+                return file_path
+            except Exception as e:
+                self.logger.error(f"Error downloading file from {url}: {e}")
+                return None
+        
+        self.logger.info(f"Downloading {len(items)} files with concurrency {concurrency}")
+        
+        connector = aiohttp.TCPConnector(limit=concurrency, ttl_dns_cache=300)
+        client_timeout = aiohttp.ClientTimeout(total=timeout)
+        async with aiohttp.ClientSession(connector=connector, timeout=client_timeout) as session:
+            results = await asyncio.gather(
+                *(download_one(session, url, filename) for url, filename in items)
+            )
+        
+        self._invalidate_listing_cache(download_dir)
+        succeeded = sum(1 for path in results if path)
+        self.logger.info(f"Downloaded {succeeded}/{len(items)} files")
+        return list(results)
+    
     def get_file_info(self, file_path: str) -> Dict[str, Any]:
         """
         Get information about a file.
@@ -407,31 +802,30 @@ class FileDownloadUtils:
         if not os.path.exists(directory):
             return 0
         
-        current_time = time.time()
-        max_age_seconds = max_age_days * 24 * 60 * 60
+        cutoff = time.time() - max_age_days * 24 * 60 * 60
+        ext_set = {ext.lower() for ext in file_extensions} if file_extensions else None
         deleted_count = 0
         
         try:
-            for filename in os.listdir(directory):
-                file_path = os.path.join(directory, filename)
-                
-                if not os.path.isfile(file_path):
-                    continue
-                
-                # Check extension filter
-                if file_extensions:
-                    file_ext = Path(file_path).suffix.lower()
-                    if file_ext not in file_extensions:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if not entry.is_file(follow_symlinks=False):
                         continue
-                
-                # Check age
-                file_age = current_time - os.path.getctime(file_path)
-                if file_age > max_age_seconds:
-                    os.remove(file_path)
-                    deleted_count += 1
-                    self.logger.debug(f"Deleted old file: {file_path}")
+                    
+                    # Check extension filter
+                    if ext_set is not None:
+                        dot = entry.name.rfind('.')
+                        if dot <= 0 or entry.name[dot:].lower() not in ext_set:
+                            continue
+                    
+                    # Check age (DirEntry.stat() is cached per entry)
+                    if entry.stat().st_ctime < cutoff:
+                        os.unlink(entry.path)
+                        deleted_count += 1
+                        self.logger.debug("Deleted old file: %s", entry.path)
             
             if deleted_count > 0:
+                self._invalidate_listing_cache(directory)
                 self.logger.info(f"Cleaned up {deleted_count} old files from {directory}")
             
             return deleted_count
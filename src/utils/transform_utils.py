@@ -8,12 +8,16 @@ standardizing column orders, and date conversions.
 Part of the src_pipeline refactoring to eliminate code duplication.
 """
 
+import os
 import pandas as pd
 import numpy as np
 import logging
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, date
 from typing import List, Optional, Union, Dict, Any
 
+logger = logging.getLogger(__name__)
+
 
 class DataTransformUtils:
     """
@@ -54,7 +58,8 @@ class DataTransformUtils:
             symbol_column: Name for symbol column (usually derived from metric)
             
         Returns:
-            Melted DataFrame in long format
+            Melted DataFrame in long format, with categorical var_name and
+            symbol columns
         """
         if df.empty:
             return df
@@ -68,23 +73,44 @@ class DataTransformUtils:
             value_columns = [col for col in df.columns if col not in id_vars]
         
         if not value_columns:
-            logging.warning("No value columns found for melting")
+            logger.warning("No value columns found for melting")
             return df
         
+        # Metric names repeat once per row, so store them as categorical codes
+        metric_dtype = pd.CategoricalDtype(categories=value_columns)
+        
         # Melt the DataFrame
-        result_df = pd.melt(
-            df,
-            id_vars=id_vars,
-            value_vars=value_columns,
-            var_name=var_name,
-            value_name=value_name
-        )
+        melt_columns = list(id_vars) + value_columns
+        if all(isinstance(df[col].dtype, np.dtype) for col in melt_columns):
+            # Plain NumPy columns: stack directly, avoiding pd.melt's intermediate frames
+            n_rows = len(df)
+            n_values = len(value_columns)
+            data = {
+                col: np.tile(df[col].to_numpy(), n_values)
+                for col in id_vars
+            }
+            data[var_name] = pd.Categorical.from_codes(
+                np.repeat(np.arange(n_values, dtype=np.int32), n_rows),
+                dtype=metric_dtype
+            )
+            data[value_name] = np.concatenate([df[col].to_numpy() for col in value_columns])
+            result_df = pd.DataFrame(data)
+        else:
+            # Extension dtypes (Arrow, nullable, categorical) keep pandas semantics
+            result_df = pd.melt(
+                df,
+                id_vars=id_vars,
+                value_vars=value_columns,
+                var_name=var_name,
+                value_name=value_name
+            )
+            result_df[var_name] = result_df[var_name].astype(metric_dtype)
         
         # Add symbol column (typically the same as metric for most sources)
         if symbol_column not in result_df.columns:
             result_df[symbol_column] = result_df[var_name]
         
-        logging.debug(f"Melted DataFrame: {df.shape} -> {result_df.shape}")
+        logger.debug("Melted DataFrame: %s -> %s", df.shape, result_df.shape)
         return result_df
     
     @staticmethod
@@ -107,23 +133,33 @@ class DataTransformUtils:
         available_columns = [col for col in expected_order if col in df.columns]
         
         # Add any extra columns not in expected_order
-        extra_columns = [col for col in df.columns if col not in expected_order]
+        expected_set = set(expected_order)
+        extra_columns = [col for col in df.columns if col not in expected_set]
         
         if extra_columns:
-            logging.debug(f"Found extra columns not in expected order: {extra_columns}")
+            logger.debug("Found extra columns not in expected order: %s", extra_columns)
             available_columns.extend(extra_columns)
         
+        # Already in order: return the frame itself rather than a reindexed copy
+        if list(df.columns) == available_columns:
+            return df
+        
         return df[available_columns]
     
     @staticmethod
     def convert_dates_to_standard_format(df: pd.DataFrame, 
-                                       date_column: str = 'date') -> pd.DataFrame:
+                                       date_column: str = 'date',
+                                       date_format: Optional[str] = None) -> pd.DataFrame:
         """
-        Convert date column to standard format (date objects).
+        Convert date column to standard format (datetime64).
+        
+        Values that cannot be parsed become NaT. Use to_python_date when
+        datetime.date objects are required downstream.
         
         Args:
             df: DataFrame with date column
             date_column: Name of the date column
+            date_format: Optional strftime format of the input (e.g. '%Y-%m-%d')
             
         Returns:
             DataFrame with standardized dates
@@ -131,15 +167,40 @@ class DataTransformUtils:
         if df.empty or date_column not in df.columns:
             return df
         
+        if pd.api.types.is_datetime64_any_dtype(df[date_column]):
+            return df
+        
         try:
-            # Convert to datetime first, then to date
-            df[date_column] = pd.to_datetime(df[date_column]).dt.date
-            logging.debug(f"Converted {date_column} to date format")
+            df[date_column] = pd.to_datetime(
+                df[date_column],
+                errors='coerce',
+                format=date_format or 'mixed',
+                cache=True
+            )
+            logger.debug("Converted %s to datetime format", date_column)
         except Exception as e:
-            logging.warning(f"Failed to convert {date_column} to date format: {e}")
+            logger.warning("Failed to convert %s to date format: %s", date_column, e)
         
         return df
     
+    @staticmethod
+    def to_python_date(df: pd.DataFrame, date_column: str = 'date') -> pd.DataFrame:
+        """
+        Convert a date column to datetime.date objects.
+        
+        Args:
+            df: DataFrame with date column
+            date_column: Name of the date column
+            
+        Returns:
+            DataFrame with date objects in the date column
+        """
+        if df.empty or date_column not in df.columns:
+            return df
+        
+        df[date_column] = pd.to_datetime(df[date_column], errors='coerce', format='mixed').dt.date
+        return df
+    
     @staticmethod
     def clean_and_validate_data(df: pd.DataFrame, 
                                required_columns: List[str],
@@ -161,7 +222,7 @@ class DataTransformUtils:
         # Check required columns
         missing_columns = [col for col in required_columns if col not in df.columns]
         if missing_columns:
-            logging.error(f"Missing required columns: {missing_columns}")
+            logger.error("Missing required columns: %s", missing_columns)
             return pd.DataFrame()  # Return empty DataFrame if required columns missing
         
         # Drop rows with NaN values in specified columns
@@ -170,11 +231,18 @@ class DataTransformUtils:
         
         available_drop_columns = [col for col in drop_na_columns if col in df.columns]
         if available_drop_columns:
-            initial_rows = len(df)
-            df = df.dropna(subset=available_drop_columns)
-            dropped_rows = initial_rows - len(df)
+            mask = np.ones(len(df), dtype=bool)
+            for col in available_drop_columns:
+                values = df[col].to_numpy()
+                if values.dtype.kind == 'f':
+                    mask &= ~np.isnan(values)
+                else:
+                    mask &= df[col].notna().to_numpy()
+            
+            dropped_rows = len(mask) - int(np.count_nonzero(mask))
             if dropped_rows > 0:
-                logging.debug(f"Dropped {dropped_rows} rows with NaN values")
+                df = df.loc[mask]
+                logger.debug("Dropped %d rows with NaN values", dropped_rows)
         
         return df
     
@@ -199,16 +267,13 @@ class DataTransformUtils:
         if exclude_columns is None:
             exclude_columns = ['date']
         
-        # Create new column mapping
-        new_columns = {}
-        for col in df.columns:
-            if col in exclude_columns:
-                new_columns[col] = col
-            else:
-                new_columns[col] = f"{prefix}{col}"
-        
-        df = df.rename(columns=new_columns)
-        logging.debug(f"Added prefix '{prefix}' to columns (excluded: {exclude_columns})")
+        # Relabel a shallow copy; rename() would copy every block
+        df = df.copy(deep=False)
+        df.columns = pd.Index([
+            col if col in exclude_columns else f"{prefix}{col}"
+            for col in df.columns
+        ])
+        logger.debug("Added prefix '%s' to columns (excluded: %s)", prefix, exclude_columns)
         
         return df
     
@@ -227,11 +292,15 @@ class DataTransformUtils:
             return df
         
         # Find percentage columns
-        percent_columns = [col for col in df.columns if '%' in str(col)]
+        percent_columns = [
+            col for col in df.columns
+            if '%' in (col if isinstance(col, str) else str(col))
+        ]
+        if not percent_columns:
+            return df
         
-        if percent_columns:
-            df = df.drop(columns=percent_columns)
-            logging.debug(f"Removed percentage columns: {percent_columns}")
+        df = df.drop(columns=percent_columns)
+        logger.debug("Removed percentage columns: %s", percent_columns)
         
         return df
     
@@ -254,13 +323,19 @@ class DataTransformUtils:
         if numeric_columns is None:
             numeric_columns = ['value'] if 'value' in df.columns else []
         
-        for col in numeric_columns:
-            if col in df.columns:
-                try:
-                    df[col] = pd.to_numeric(df[col], errors='coerce')
-                    logging.debug(f"Converted {col} to numeric type")
-                except Exception as e:
-                    logging.warning(f"Failed to convert {col} to numeric: {e}")
+        # Columns that are already numeric need no conversion
+        cols = [
+            col for col in numeric_columns
+            if col in df.columns and not pd.api.types.is_numeric_dtype(df[col])
+        ]
+        if not cols:
+            return df
+        
+        try:
+            df[cols] = df[cols].apply(pd.to_numeric, errors='coerce')
+            logger.debug("Converted %s to numeric type", cols)
+        except Exception as e:
+            logger.warning("Failed to convert %s to numeric: %s", cols, e)
         
         return df
     
@@ -281,6 +356,9 @@ class DataTransformUtils:
         5. Convert dates to standard format
         6. Clean and validate data
         
+        Frames that are already in long format (only id_vars plus 'value'
+        and 'metric'/'symbol' columns) skip steps 1-3.
+        
         Args:
             df: DataFrame to transform
             id_vars: Columns to use as identifier variables for melting
@@ -291,29 +369,70 @@ class DataTransformUtils:
         Returns:
             Fully processed DataFrame
         """
-        utils = cls()
-        
         if df.empty:
             return df
         
-        # Step 1: Add prefix if specified
-        if prefix:
-            df = cls.add_prefix_to_columns(df, prefix, exclude_columns=[date_column])
+        value_cols = {col for col in df.columns if col not in id_vars}
+        already_long = {'value'} < value_cols <= {'metric', 'value', 'symbol'}
         
-        # Step 2: Remove percentage columns
-        df = cls.remove_percentage_columns(df)
-        
-        # Step 3: Melt to long format
-        df = cls.melt_to_long_format(df, id_vars)
+        if not already_long:
+            # Step 1: Add prefix if specified
+            if prefix:
+                df = cls.add_prefix_to_columns(df, prefix, exclude_columns=[date_column])
+            
+            # Step 2: Remove percentage columns
+            df = cls.remove_percentage_columns(df)
+            
+            # Step 3: Melt to long format
+            df = cls.melt_to_long_format(df, id_vars)
         
         # Step 4: Standardize column order  
         df = cls.standardize_column_order(df, expected_order)
         
-        # Step 5: Convert dates
+        # Step 5: Convert dates (no-op when already datetime64)
         df = cls.convert_dates_to_standard_format(df, date_column)
         
         # Step 6: Clean and validate
         df = cls.clean_and_validate_data(df, expected_order)
         
-        logging.info(f"Applied standard transformation pipeline: final shape {df.shape}")
-        return df 
\ No newline at end of file
+        logger.info("Applied standard transformation pipeline: final shape %s", df.shape)
+        return df 
+    
+    @classmethod
+    def apply_standard_pipeline_batch(cls, dfs: List[pd.DataFrame],
+                                     id_vars: List[str],
+                                     expected_order: List[str],
+                                     prefix: Optional[str] = None,
+                                     date_column: str = 'date',
+                                     max_workers: Optional[int] = None) -> List[pd.DataFrame]:
+        """
+        Apply the standard pipeline to several DataFrames in parallel processes.
+        
+        Args:
+            dfs: DataFrames to transform
+            id_vars: Columns to use as identifier variables for melting
+            expected_order: Expected column order for final DataFrames
+            prefix: Optional prefix to add to value columns
+            date_column: Name of date column
+            max_workers: Number of worker processes (defaults to CPU count)
+            
+        Returns:
+            Processed DataFrames, in the same order as dfs
+        """
+        workers = min(max_workers or os.cpu_count() or 1, len(dfs))
+        args = [(df, id_vars, expected_order, prefix, date_column) for df in dfs]
+        
+        # Not worth spawning processes for a single frame
+        if workers <= 1:
+            return [_run_standard_pipeline(arg) for arg in args]
+        
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(_run_standard_pipeline, args))
+
+
+def _run_standard_pipeline(args: tuple) -> pd.DataFrame:
+    """Process-pool entry point for DataTransformUtils.apply_standard_pipeline."""
+    df, id_vars, expected_order, prefix, date_column = args
+    return DataTransformUtils.apply_standard_pipeline(
+        df, id_vars, expected_order, prefix=prefix, date_column=date_column
+    )
@@ -9,16 +9,255 @@ Part of the src_pipeline refactoring to eliminate code duplication.
 """
 
 import os
+import re
+import json
 import time
+import queue
 import random
 import logging
-from typing import Optional, Dict, Any
+import shutil
+import sys
+import platform
+import tempfile
+import threading
+import itertools
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Dict, Any, Callable, List
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.common.exceptions import (
+    JavascriptException,
+    StaleElementReferenceException,
+    TimeoutException,
+    WebDriverException,
+)
 from selenium_stealth import stealth
 
 
+# Standard Chrome arguments for stability and stealth
+CHROME_BASE_ARGS = (
+    "--disable-extensions",
+    "--disable-gpu",
+    "--disable-dev-shm-usage",
+    "--no-sandbox",
+    "--disable-blink-features=AutomationControlled",
+    "--disable-web-security",
+    "--allow-running-insecure-content",
+    "--disable-features=VizDisplayCompositor",
+)
+
+# Fallback only, for when the running browser doesn't report its version
+DEFAULT_USER_AGENT = ("Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+                      "AppleWebKit/537.36 (KHTML, like Gecko) "
+                      "Chrome/112.0.0.0 Safari/537.36")
+
+# (User-Agent platform token, sec-ch-ua-platform, navigator.platform) for the
+# host the browser runs on, so the UA, client hints and navigator agree
+_HOST_PLATFORMS = {
+    "win32": ("Windows NT 10.0; Win64; x64", "Windows", "Win32"),
+    "darwin": ("Macintosh; Intel Mac OS X 10_15_7", "macOS", "MacIntel"),
+}
+_LINUX_PLATFORM = ("X11; Linux x86_64", "Linux", "Linux x86_64")
+HOST_PLATFORM = _HOST_PLATFORMS.get(sys.platform, _LINUX_PLATFORM)
+HOST_ARCHITECTURE = "arm" if platform.machine().lower() in ("arm64", "aarch64") else "x86"
+
+# Captures (full, major) version from a Chrome User-Agent string
+CHROME_VERSION_RE = re.compile(r"Chrome/((\d+)[\d.]*)")
+
+# Opt-in persistent profile so DNS, TLS session and HTTP caches survive across
+# drivers; pass it as user_data_dir only where one driver runs at a time, since
+# Chrome locks a profile while it's in use
+DEFAULT_USER_DATA_DIR = os.path.join(tempfile.gettempdir(), "euclid_chrome_profile")
+DISK_CACHE_SIZE = 100 * 1024 * 1024
+
+# Chrome download preferences (download.default_directory is filled per driver)
+DOWNLOAD_PREFS_TEMPLATE = {
+    "download.prompt_for_download": False,
+    "download.directory_upgrade": True,
+    "safebrowsing.enabled": False,
+    "plugins.always_open_pdf_externally": True,
+    "profile.default_content_settings.popups": 0,
+    "profile.default_content_setting_values.automatic_downloads": 1,
+}
+
+# Installed once per driver; runs before page scripts on every navigation
+HIDE_WEBDRIVER_SCRIPT = (
+    "Object.defineProperty(navigator, 'webdriver', {get: () => undefined});"
+    "window.chrome = window.chrome || {runtime: {}};"
+)
+
+# Resources the scrapers never need; blocking them lets pages finish loading sooner
+BLOCKED_URL_PATTERNS = (
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg",
+    "*.woff", "*.woff2", "*.ttf", "*.mp4",
+    "*googletagmanager*", "*google-analytics*", "*doubleclick*",
+)
+
+# Page text that indicates the request was blocked
+ACCESS_DENIED_PATTERNS = (
+    "access denied",
+    "forbidden",
+    "403 forbidden",
+    "access to this resource on the server is denied",
+    "you don't have permission to access",
+)
+
+# Single-pass, case-insensitive scan for any of the patterns above
+ACCESS_DENIED_RE = re.compile(
+    "|".join(re.escape(p) for p in ACCESS_DENIED_PATTERNS), re.IGNORECASE
+)
+
+
+# Returns {element, text, href, classes} for <a> tags whose visible text
+# contains arguments[0]; arguments[1] toggles case sensitivity
+FIND_LINKS_SCRIPT = """
+const cs = arguments[1];
+const norm = cs ? (s) => s : (s) => s.toUpperCase();
+const needle = norm(arguments[0]);
+const matches = [];
+for (const a of document.getElementsByTagName('a')) {
+    const text = (a.innerText || a.textContent || '').trim();
+    if (norm(text).includes(needle)) {
+        matches.push({
+            element: a,
+            text: text,
+            href: a.href || a.getAttribute('href'),
+            classes: a.getAttribute('class')
+        });
+    }
+}
+return matches;
+"""
+
+
+# True when arguments[0] is fully inside the viewport
+IN_VIEWPORT_SCRIPT = (
+    "const r = arguments[0].getBoundingClientRect();"
+    "return r.top >= 0 && r.left >= 0"
+    " && r.bottom <= window.innerHeight && r.right <= window.innerWidth;"
+)
+
+
+def block_page_resources(driver: webdriver.Chrome,
+                         logger: Optional[logging.Logger] = None) -> None:
+    """
+    Block images, fonts, media and analytics requests for a driver via CDP.
+    
+    Args:
+        driver: Chrome driver to configure
+        logger: Optional logger for failures
+    """
+    try:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": list(BLOCKED_URL_PATTERNS)})
+    except WebDriverException as e:
+        (logger or logging.getLogger("web_scraping_utils")).warning(
+            f"Could not block page resources: {e}"
+        )
+
+
+class WebDriverPool:
+    """
+    Thread-safe pool of reusable Chrome drivers.
+    
+    Drivers are created lazily by a factory, up to the pool size, and are
+    returned to the pool after use instead of being quit, so later requests
+    skip browser start-up.
+    """
+    
+    def __init__(self,
+                 driver_factory: Callable[[], webdriver.Chrome],
+                 size: int = 5,
+                 logger_name: Optional[str] = None):
+        """
+        Initialize the driver pool.
+        
+        Args:
+            driver_factory: Callable that creates a configured driver
+            size: Maximum number of drivers in the pool
+            logger_name: Optional custom logger name
+        """
+        self.logger = logging.getLogger(logger_name or "web_driver_pool")
+        self.driver_factory = driver_factory
+        self.size = max(1, size)
+        self._idle: "queue.Queue[webdriver.Chrome]" = queue.Queue()
+        self._drivers: List[webdriver.Chrome] = []
+        self._created = 0
+        self._lock = threading.Lock()
+    
+    def acquire(self, timeout: Optional[float] = None) -> webdriver.Chrome:
+        """
+        Check out a driver, creating one if the pool is not yet full.
+        
+        Args:
+            timeout: Maximum time to wait for a free driver (None waits forever)
+            
+        Returns:
+            Chrome driver reserved for the caller
+        """
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+        
+        with self._lock:
+            # Reserve the slot before the (slow) driver start-up
+            create = self._created < self.size
+            if create:
+                self._created += 1
+        
+        if create:
+            try:
+                driver = self.driver_factory()
+            except Exception:
+                with self._lock:
+                    self._created -= 1
+                raise
+            with self._lock:
+                self._drivers.append(driver)
+            self.logger.debug(f"Created pooled driver ({len(self._drivers)}/{self.size})")
+            return driver
+        
+        return self._idle.get(timeout=timeout)
+    
+    def release(self, driver: webdriver.Chrome) -> None:
+        """
+        Return a driver to the pool.
+        
+        Args:
+            driver: Driver previously obtained from acquire()
+        """
+        self._idle.put(driver)
+    
+    def close(self) -> None:
+        """Quit every driver created by the pool."""
+        with self._lock:
+            drivers = self._drivers
+            self._drivers = []
+            self._created = 0
+        
+        while not self._idle.empty():
+            try:
+                self._idle.get_nowait()
+            except queue.Empty:
+                break
+        
+        for driver in drivers:
+            try:
+                driver.quit()
+            except Exception as e:
+                self.logger.warning(f"Error closing pooled driver: {e}")
+    
+    def __enter__(self):
+        """Context manager entry."""
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit - quit all drivers."""
+        self.close()
+
+
 class WebScrapingUtils:
     """
     Utility class for web scraping operations using Selenium.
@@ -40,12 +279,16 @@ class WebScrapingUtils:
         """
         self.logger = logging.getLogger(logger_name or "web_scraping_utils")
         self.driver: Optional[webdriver.Chrome] = None
+        self._user_agent: Optional[str] = None
         
     def setup_chrome_driver(self, 
                            download_dir: str,
                            headless: bool = True,
                            window_size: str = "1920,1080",
-                           user_agent: Optional[str] = None) -> webdriver.Chrome:
+                           user_agent: Optional[str] = None,
+                           user_data_dir: Optional[str] = None,
+                           block_resources: bool = True,
+                           override_user_agent: bool = True) -> webdriver.Chrome:
         """
         Set up Chrome driver with standard options.
         
@@ -54,6 +297,13 @@ class WebScrapingUtils:
             headless: Whether to run in headless mode
             window_size: Browser window size
             user_agent: Custom user agent string
+            user_data_dir: Chrome profile directory to reuse across sessions,
+                e.g. DEFAULT_USER_DATA_DIR (None for a fresh temporary
+                profile). Concurrent drivers need distinct directories.
+            block_resources: Whether to block images, fonts, media and trackers
+            override_user_agent: Whether to set the User-Agent and client hints
+                via CDP now; pass False when apply_stealth_settings follows,
+                since it applies the override itself
             
         Returns:
             Configured Chrome driver instance
@@ -61,67 +311,151 @@ class WebScrapingUtils:
         self.logger.info("Setting up Chrome driver...")
         
         # Ensure download directory exists
-        self.ensure_download_directory(download_dir)
+        abs_download_dir = self.ensure_download_directory(download_dir)
         
-        # Setup Chrome options
-        options = Options()
-        
-        # Standard arguments for stability and stealth
-        standard_args = [
-            "--disable-extensions",
-            "--disable-gpu", 
-            "--disable-dev-shm-usage",
-            "--no-sandbox",
-            f"--window-size={window_size}",
-            "--disable-blink-features=AutomationControlled",
-            "--disable-web-security",
-            "--allow-running-insecure-content",
-            "--disable-features=VizDisplayCompositor"
-        ]
-        
-        for arg in standard_args:
-            options.add_argument(arg)
-        
-        # Add headless mode if requested
-        if headless:
-            options.add_argument("--headless=new")
-        
-        # Set user agent
-        if user_agent is None:
-            user_agent = ("Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-                         "AppleWebKit/537.36 (KHTML, like Gecko) "
-                         "Chrome/112.0.0.0 Safari/537.36")
-        
-        options.add_argument(f"--user-agent={user_agent}")
+        options = self._build_options(abs_download_dir, headless, window_size, user_agent)
         
-        # Setup download preferences
-        prefs = self.get_download_preferences(download_dir)
-        options.add_experimental_option("prefs", prefs)
-        
-        # Exclude automation switches
-        options.add_experimental_option("excludeSwitches", ["enable-automation"])
-        options.add_experimental_option('useAutomationExtension', False)
+        if user_data_dir:
+            options.add_argument(f"--user-data-dir={user_data_dir}")
+            options.add_argument(f"--disk-cache-dir={os.path.join(user_data_dir, 'cache')}")
+            options.add_argument(f"--disk-cache-size={DISK_CACHE_SIZE}")
         
         # Initialize driver
         self.logger.info("Initializing Chrome driver...")
         try:
             self.driver = webdriver.Chrome(options=options)
             
-            # Execute script to remove webdriver property
-            self.driver.execute_script(
-                "Object.defineProperty(navigator, 'webdriver', {get: () => undefined})"
+            # Hide the webdriver property on every document before page scripts run
+            self.driver.execute_cdp_cmd(
+                "Page.addScriptToEvaluateOnNewDocument", {"source": HIDE_WEBDRIVER_SCRIPT}
             )
             
+            # Keep "HeadlessChrome" out of the User-Agent and client hints
+            self._user_agent = user_agent
+            if override_user_agent:
+                self._override_user_agent(user_agent)
+            
+            if block_resources:
+                block_page_resources(self.driver, self.logger)
+            
             return self.driver
             
         except Exception as e:
             self.logger.error(f"Failed to initialize Chrome driver: {e}")
             raise
     
+    def _override_user_agent(self,
+                             user_agent: Optional[str] = None,
+                             accept_language: Optional[str] = None,
+                             navigator_platform: Optional[str] = None) -> None:
+        """
+        Override the User-Agent and sec-ch-ua client hints via CDP.
+        
+        Headless Chrome advertises itself as "HeadlessChrome" in both, which
+        many sites answer with 403s. Without a custom user agent, one is built
+        from the running browser's version and the host platform so the
+        client hints match the real browser.
+        
+        Args:
+            user_agent: User agent string to present (derived if None)
+            accept_language: Optional Accept-Language value to send as well
+            navigator_platform: navigator.platform value (matches the UA if None)
+        """
+        browser_version = None
+        if user_agent is None:
+            browser_version = self.driver.capabilities.get("browserVersion")
+            if browser_version:
+                major = browser_version.split(".")[0]
+                user_agent = (f"Mozilla/5.0 ({HOST_PLATFORM[0]}) AppleWebKit/537.36 "
+                              f"(KHTML, like Gecko) Chrome/{major}.0.0.0 Safari/537.36")
+            else:
+                user_agent = DEFAULT_USER_AGENT
+        
+        # Take the platform hints from the UA itself so they always agree with it
+        if "Windows" in user_agent:
+            _, hint_platform, default_navigator_platform = _HOST_PLATFORMS["win32"]
+        elif "Macintosh" in user_agent:
+            _, hint_platform, default_navigator_platform = _HOST_PLATFORMS["darwin"]
+        else:
+            _, hint_platform, default_navigator_platform = _LINUX_PLATFORM
+        
+        user_agent = user_agent.replace("HeadlessChrome", "Chrome")
+        override: Dict[str, Any] = {
+            "userAgent": user_agent,
+            "platform": navigator_platform or default_navigator_platform,
+        }
+        if accept_language:
+            override["acceptLanguage"] = accept_language
+        
+        match = CHROME_VERSION_RE.search(user_agent)
+        if match:
+            major = match.group(2)
+            override["userAgentMetadata"] = {
+                "brands": [
+                    {"brand": "Chromium", "version": major},
+                    {"brand": "Google Chrome", "version": major},
+                    {"brand": "Not=A?Brand", "version": "99"},
+                ],
+                "fullVersion": browser_version or match.group(1),
+                "platform": hint_platform,
+                "platformVersion": "",
+                "architecture": HOST_ARCHITECTURE,
+                "model": "",
+                "mobile": False,
+            }
+        
+        try:
+            self.driver.execute_cdp_cmd("Network.setUserAgentOverride", override)
+        except WebDriverException as e:
+            self.logger.warning(f"Could not override user agent: {e}")
+    
+    def _build_options(self,
+                       abs_download_dir: str,
+                       headless: bool,
+                       window_size: str,
+                       user_agent: Optional[str]) -> Options:
+        """
+        Build Chrome options from the module-level defaults.
+        
+        Args:
+            abs_download_dir: Absolute directory for downloads
+            headless: Whether to run in headless mode
+            window_size: Browser window size
+            user_agent: Custom user agent string (None keeps the browser's own,
+                which the CDP override then cleans up)
+            
+        Returns:
+            Configured Chrome options
+        """
+        options = Options()
+        
+        for arg in CHROME_BASE_ARGS:
+            options.add_argument(arg)
+        options.add_argument(f"--window-size={window_size}")
+        
+        # Add headless mode if requested
+        if headless:
+            options.add_argument("--headless=new")
+        
+        if user_agent:
+            options.add_argument(f"--user-agent={user_agent}")
+        
+        # Setup download preferences (path is already absolute)
+        options.add_experimental_option("prefs", {
+            "download.default_directory": abs_download_dir,
+            **DOWNLOAD_PREFS_TEMPLATE,
+        })
+        
+        # Exclude automation switches
+        options.add_experimental_option("excludeSwitches", ["enable-automation"])
+        options.add_experimental_option('useAutomationExtension', False)
+        
+        return options
+    
     def apply_stealth_settings(self, 
                               languages: list = None,
                               vendor: str = "Google Inc.",
-                              platform: str = "Win32",
+                              platform: Optional[str] = None,
                               webgl_vendor: str = "Intel Inc.",
                               renderer: str = "Intel Iris OpenGL Engine") -> None:
         """
@@ -130,7 +464,7 @@ class WebScrapingUtils:
         Args:
             languages: List of languages for stealth
             vendor: WebGL vendor string
-            platform: Platform string
+            platform: navigator.platform value (the host's if None)
             webgl_vendor: WebGL vendor string 
             renderer: WebGL renderer string
         """
@@ -139,6 +473,8 @@ class WebScrapingUtils:
         
         if languages is None:
             languages = ["en-US", "en"]
+        if platform is None:
+            platform = HOST_PLATFORM[2]
         
         self.logger.debug("Applying stealth settings...")
         
@@ -151,6 +487,11 @@ class WebScrapingUtils:
             renderer=renderer,
             fix_hairline=True,
         )
+        
+        # stealth sends its own setUserAgentOverride without client hints;
+        # apply ours last so the UA, hints and platform come from the real browser
+        self._override_user_agent(self._user_agent, accept_language=",".join(languages),
+                                  navigator_platform=platform)
     
     def get_download_preferences(self, download_dir: str) -> Dict[str, Any]:
         """
@@ -164,12 +505,7 @@ class WebScrapingUtils:
         """
         return {
             "download.default_directory": os.path.abspath(download_dir),
-            "download.prompt_for_download": False,
-            "download.directory_upgrade": True,
-            "safebrowsing.enabled": False,
-            "plugins.always_open_pdf_externally": True,
-            "profile.default_content_settings.popups": 0,
-            "profile.default_content_setting_values.automatic_downloads": 1,
+            **DOWNLOAD_PREFS_TEMPLATE,
         }
     
     def ensure_download_directory(self, download_dir: str) -> str:
@@ -194,25 +530,41 @@ class WebScrapingUtils:
     
     def navigate_with_delay(self, url: str, 
                            min_delay: float = 2.0, 
-                           max_delay: float = 4.0) -> None:
+                           max_delay: float = 4.0,
+                           human_delay: bool = True,
+                           wait_ready: bool = True) -> None:
         """
         Navigate to URL with random delay to appear human-like.
         
+        Time spent waiting for the page to become ready counts toward the
+        delay, so the two are overlapped rather than added together.
+        
         Args:
             url: URL to navigate to
             min_delay: Minimum delay in seconds
             max_delay: Maximum delay in seconds
+            human_delay: Whether to apply the random delay at all
+            wait_ready: Whether to wait for document.readyState == 'complete'
         """
         if not self.driver:
             raise ValueError("Driver must be initialized before navigation")
         
         self.logger.info(f"Navigating to: {url}")
+        start_time = time.time()
         self.driver.get(url)
         
-        # Random delay to appear human-like
+        if wait_ready:
+            self.wait_for_page_load(timeout=max(10, int(max_delay)))
+        
+        if not human_delay:
+            return
+        
+        # Random delay to appear human-like, less time already spent loading
         delay = random.uniform(min_delay, max_delay)
-        self.logger.debug(f"Waiting {delay:.1f} seconds...")
-        time.sleep(delay)
+        remaining = delay - (time.time() - start_time)
+        if remaining > 0:
+            self.logger.debug(f"Waiting {remaining:.1f} seconds...")
+            time.sleep(remaining)
     
     def check_access_denied(self) -> bool:
         """
@@ -224,20 +576,12 @@ class WebScrapingUtils:
         if not self.driver:
             return False
             
-        page_source = self.driver.page_source.lower()
-        access_denied_patterns = [
-            "access denied",
-            "forbidden", 
-            "403 forbidden",
-            "access to this resource on the server is denied",
-            "you don't have permission to access"
-        ]
-        
-        for pattern in access_denied_patterns:
-            if pattern in page_source:
-                self.logger.warning(f"Access denied detected: {pattern}")
-                return True
-                
+        match = ACCESS_DENIED_RE.search(self.driver.page_source)
+        
+        if match:
+            self.logger.warning(f"Access denied detected: {match.group(0).lower()}")
+            return True
+            
         return False
     
     def wait_for_page_load(self, driver=None, timeout: int = 10) -> bool:
@@ -259,21 +603,16 @@ class WebScrapingUtils:
             return False
         
         try:
-            import time
-            start_time = time.time()
-            
-            while time.time() - start_time < timeout:
-                try:
-                    # Check if page is ready
-                    ready_state = driver.execute_script("return document.readyState")
-                    if ready_state == "complete":
-                        self.logger.debug("Page loaded successfully")
-                        return True
-                except:
-                    pass
-                
-                time.sleep(0.5)
+            # Poll readyState; script errors and stale documents during
+            # navigation are retried, a dead session fails straight away
+            WebDriverWait(
+                driver, timeout, poll_frequency=0.1,
+                ignored_exceptions=(JavascriptException, StaleElementReferenceException)
+            ).until(lambda d: d.execute_script("return document.readyState") == "complete")
+            self.logger.debug("Page loaded successfully")
+            return True
             
+        except TimeoutException:
             self.logger.warning(f"Page load timeout after {timeout} seconds")
             return False
             
@@ -282,44 +621,62 @@ class WebScrapingUtils:
             return False
     
     def find_links_by_text(self, search_text: str, 
-                          case_sensitive: bool = False) -> list:
+                          case_sensitive: bool = False,
+                          include_elements: bool = True) -> list:
         """
         Find links containing specific text.
         
         Args:
             search_text: Text to search for in links
             case_sensitive: Whether search should be case sensitive
+            include_elements: Whether to return WebElements; when False the
+                query runs through CDP Runtime.evaluate and returns plain values
             
         Returns:
-            List of matching link elements
+            List of dicts with 'text', 'href', 'classes' (and 'element')
         """
         if not self.driver:
             raise ValueError("Driver must be initialized before finding links")
         
-        all_links = self.driver.find_elements(By.TAG_NAME, "a")
-        matching_links = []
-        
-        search_text_processed = search_text if case_sensitive else search_text.upper()
-        
-        for link in all_links:
-            try:
-                link_text = link.text.strip()
-                link_text_processed = link_text if case_sensitive else link_text.upper()
-                
-                if search_text_processed in link_text_processed:
-                    matching_links.append({
-                        'element': link,
-                        'text': link_text,
-                        'href': link.get_attribute('href'),
-                        'classes': link.get_attribute('class')
-                    })
-            except Exception as e:
-                self.logger.debug(f"Error processing link: {e}")
-                continue
+        # Filter in the page and return everything in one round trip
+        if include_elements:
+            matching_links = self.driver.execute_script(
+                FIND_LINKS_SCRIPT, search_text, case_sensitive
+            ) or []
+        else:
+            matching_links = self._find_links_by_value(search_text, case_sensitive)
         
         self.logger.info(f"Found {len(matching_links)} links containing '{search_text}'")
         return matching_links
     
+    def _find_links_by_value(self, search_text: str, case_sensitive: bool) -> list:
+        """
+        Run the link query via CDP Runtime.evaluate, returning values only.
+        
+        Args:
+            search_text: Text to search for in links
+            case_sensitive: Whether search should be case sensitive
+            
+        Returns:
+            List of dicts with 'text', 'href' and 'classes'
+        """
+        expression = (
+            f"(function() {{{FIND_LINKS_SCRIPT}}})"
+            f".apply(null, {json.dumps([search_text, case_sensitive])})"
+            ".map(({element, ...link}) => link)"
+        )
+        response = self.driver.execute_cdp_cmd("Runtime.evaluate", {
+            "expression": expression,
+            "returnByValue": True,
+            "awaitPromise": False,
+        })
+        
+        if response.get("exceptionDetails"):
+            self.logger.warning(f"Link query failed: {response['exceptionDetails'].get('text')}")
+            return []
+        
+        return response.get("result", {}).get("value") or []
+    
     def safe_click(self, element, max_retries: int = 3) -> bool:
         """
         Safely click an element with retries.
@@ -333,24 +690,99 @@ class WebScrapingUtils:
         """
         for attempt in range(max_retries):
             try:
-                # Scroll element into view
-                self.driver.execute_script("arguments[0].scrollIntoView(true);", element)
-                time.sleep(0.5)
+                # Only scroll when the element is outside the viewport
+                if not self.driver.execute_script(IN_VIEWPORT_SCRIPT, element):
+                    self.driver.execute_script("arguments[0].scrollIntoView(true);", element)
                 
                 # Try to click
                 element.click()
                 self.logger.debug("Element clicked successfully")
                 return True
                 
-            except Exception as e:
+            except WebDriverException as e:
+                # Includes intercepted clicks and stale elements
                 self.logger.warning(f"Click attempt {attempt + 1} failed: {e}")
-                if attempt < max_retries - 1:
-                    time.sleep(1)
-                else:
-                    self.logger.error("All click attempts failed")
+            
+            # A JS click bypasses overlays that intercept native clicks
+            try:
+                self.driver.execute_script("arguments[0].click();", element)
+                self.logger.debug("Element clicked via JavaScript")
+                return True
+            except WebDriverException as e:
+                self.logger.debug(f"JavaScript click failed: {e}")
+            
+            if attempt < max_retries - 1:
+                time.sleep(min(2.0, 0.25 * (2 ** attempt)))
+            else:
+                self.logger.error("All click attempts failed")
                     
         return False
     
+    def scrape_batch(self,
+                     urls: List[str],
+                     handler: Callable[[webdriver.Chrome], Any],
+                     download_dir: str,
+                     max_concurrency: int = 5,
+                     headless: bool = True,
+                     pool: Optional[WebDriverPool] = None) -> List[Any]:
+        """
+        Scrape several URLs concurrently using a pool of warm drivers.
+        
+        Args:
+            urls: URLs to load
+            handler: Called with the driver after each page loads; its
+                return value is collected
+            download_dir: Directory for downloads of pooled drivers
+            max_concurrency: Maximum number of browsers used at once
+            headless: Whether pooled drivers run headless
+            pool: Optional existing pool to reuse across batches (left open)
+            
+        Returns:
+            Handler results in the same order as urls (None for failures)
+        """
+        if not urls:
+            return []
+        
+        owns_pool = pool is None
+        profile_root = None
+        if owns_pool:
+            # Each pooled browser gets its own profile under a directory private
+            # to this batch; Chrome locks profiles in use
+            profile_root = tempfile.mkdtemp(prefix="euclid_chrome_batch_")
+            worker_ids = itertools.count()
+            pool = WebDriverPool(
+                lambda: WebScrapingUtils(self.logger.name).setup_chrome_driver(
+                    download_dir, headless=headless,
+                    user_data_dir=os.path.join(profile_root, f"worker_{next(worker_ids)}")
+                ),
+                size=min(max_concurrency, len(urls)),
+                logger_name=self.logger.name
+            )
+        
+        def scrape_one(url: str) -> Any:
+            driver = None
+            try:
+                # A driver that fails to start only fails this URL
+                driver = pool.acquire()
+                driver.get(url)
+                return handler(driver)
+            except Exception as e:
+                self.logger.error(f"Error scraping {url}: {e}")
+                return None
+            finally:
+                if driver is not None:
+                    pool.release(driver)
+        
+        self.logger.info(f"Scraping {len(urls)} URLs with up to {pool.size} drivers")
+        
+        try:
+            with ThreadPoolExecutor(max_workers=pool.size) as executor:
+                return list(executor.map(scrape_one, urls))
+        finally:
+            if owns_pool:
+                pool.close()
+                shutil.rmtree(profile_root, ignore_errors=True)
+    
     def cleanup_driver(self) -> None:
         """
         Clean up the driver and close browser.
@@ -387,7 +819,9 @@ class WebScrapingUtils:
             WebScrapingUtils instance with configured driver
         """
         scraper = cls()
-        scraper.setup_chrome_driver(download_dir, headless=headless)
+        # With stealth the user agent override is applied once, after stealth
+        scraper.setup_chrome_driver(download_dir, headless=headless,
+                                    override_user_agent=not apply_stealth)
         
         if apply_stealth:
             scraper.apply_stealth_settings()
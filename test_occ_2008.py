@@ -33,10 +33,11 @@ def test_occ_2008():
         
         if len(df) > 0:
             print("\nFirst 10 records:")
-            print(df.head(10))
+            print(df.iloc[:10, :6].to_string(index=False, max_colwidth=30))
             
             print(f"\nUnique metrics: {df['metric'].unique()}")
-            print(f"Date range: {df['date'].min()} to {df['date'].max()}")
+            date_min, date_max = df['date'].agg(['min', 'max'])
+            print(f"Date range: {date_min} to {date_max}")
             
             # Show summary by metric
             print("\nSummary by metric:")
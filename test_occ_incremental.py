@@ -34,18 +34,23 @@ def test_occ_incremental():
         
         if len(df) > 0:
             print("\nFirst 10 records:")
-            print(df.head(10))
+            print(df.iloc[:10, :6].to_string(index=False, max_colwidth=30))
             
             print(f"\nUnique metrics: {df['metric'].unique()}")
-            print(f"Date range: {df['date'].min()} to {df['date'].max()}")
+            date_min, date_max = df['date'].agg(['min', 'max'])
+            print(f"Date range: {date_min} to {date_max}")
             
-            # Check if individual month files were created
+            # Check if individual month partitions were created
             print("\n📁 Checking individual month files:")
             for year in [2008]:
-                year_dir = os.path.join(fetcher.download_dir, str(year))
+                year_dir = os.path.join(fetcher.download_dir, f"year={year}")
                 if os.path.exists(year_dir):
-                    files = [f for f in os.listdir(year_dir) if f.endswith('.csv')]
-                    print(f"  {year}/: {files}")
+                    partitions = sorted(
+                        os.path.join(entry.name, name)
+                        for entry in os.scandir(year_dir) if entry.is_dir()
+                        for name in os.listdir(entry.path) if name.endswith('.parquet')
+                    )
+                    print(f"  year={year}/: {partitions}")
             
         else:
             print("❌ No data retrieved")
@@ -2,10 +2,15 @@
 Simple test script for OCC data fetcher
 """
 
+import os
+import asyncio
+import numpy as np
 import pandas as pd
+import pyarrow.parquet as pq
 from datetime import datetime, date
 from dateutil.relativedelta import relativedelta
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 import sys
 
 # Add src to path
@@ -13,21 +18,40 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from src.fetchers.fetch_occ import OCCDailyDataFetcher
 
+TEST_DIR = Path("data/raw/occ_test")
+TODAY = datetime.now().date()
+BYTES_TO_MB = 1 / (1024 * 1024)
 
-def test_single_month():
+# Upper bound on headless Chrome instances hitting OCC at once
+MAX_BROWSERS = 4
+
+
+def test_convert_without_daily_rows(fetcher: OCCDailyDataFetcher):
+    """Check that a month whose tables have no M/D rows converts to an empty frame."""
+    print("=" * 60)
+    print("TEST 0: Conversion Without Daily Rows (offline)")
+    print("=" * 60)
+    
+    month_data = {
+        'year': 2024,
+        'month': 1,
+        'occ_contract_volume': pd.DataFrame([["Total", 1, 2, 3, 4, 10]]),
+        'futures_contract_volume': pd.DataFrame([["Total", 1, 2]]),
+    }
+    df = fetcher.convert_to_long_format([month_data])
+    
+    assert df.empty, f"Expected no rows, got {len(df)}"
+    print("✅ Table without daily rows converted to an empty frame")
+
+
+def test_single_month(fetcher: OCCDailyDataFetcher):
     """Test fetching a single month of data."""
     print("=" * 60)
     print("TEST 1: Single Month Fetch")
     print("=" * 60)
     
-    fetcher = OCCDailyDataFetcher(download_dir="data/raw/occ_test")
-    
     # Get previous month to ensure data exists
-    today = datetime.now().date()
-    if today.month == 1:
-        test_date = date(today.year - 1, 12, 1)
-    else:
-        test_date = date(today.year, today.month - 1, 1)
+    test_date = TODAY.replace(day=1) - relativedelta(months=1)
     
     print(f"Fetching data for: {test_date.strftime('%B %Y')}")
     
@@ -35,26 +59,25 @@ def test_single_month():
     
     if not df.empty:
         print(f"✅ Success! Fetched {len(df)} records")
-        print(f"Date range: {df['date'].min()} to {df['date'].max()}")
+        date_min, date_max = df['date'].agg(['min', 'max'])
+        print(f"Date range: {date_min} to {date_max}")
         print(f"Metrics found: {df['metric'].unique()}")
         print("\nSample data:")
-        print(df.head(10))
+        print(df.iloc[:10, :6].to_string(index=False, max_colwidth=30))
     else:
         print("❌ No data fetched")
     
     return df
 
 
-def test_date_range():
+def test_date_range(fetcher: OCCDailyDataFetcher):
     """Test fetching a range of months."""
     print("\n" + "=" * 60)
     print("TEST 2: Date Range Fetch")
     print("=" * 60)
     
-    fetcher = OCCDailyDataFetcher(download_dir="data/raw/occ_test")
-    
     # Fetch last 3 months
-    end_date = datetime.now().date()
+    end_date = TODAY
     start_date = end_date - relativedelta(months=3)
     
     print(f"Fetching data from {start_date} to {end_date}")
@@ -63,13 +86,15 @@ def test_date_range():
     
     if not df.empty:
         print(f"✅ Success! Fetched {len(df)} records")
-        print(f"Date range: {df['date'].min()} to {df['date'].max()}")
+        date_min, date_max = df['date'].agg(['min', 'max'])
+        print(f"Date range: {date_min} to {date_max}")
         
-        # Show monthly breakdown
-        df['month'] = pd.to_datetime(df['date']).dt.to_period('M')
-        monthly_counts = df.groupby('month').size()
+        # Show monthly breakdown (datetime64[M] keys stay integer-backed,
+        # unlike Period objects, and df is left untouched)
+        months = pd.to_datetime(df['date']).to_numpy().astype('datetime64[M]')
+        month_keys, counts = np.unique(months, return_counts=True)
         print("\nRecords per month:")
-        for month, count in monthly_counts.items():
+        for month, count in zip(np.datetime_as_string(month_keys, unit='M'), counts):
             print(f"  {month}: {count:,} records")
     else:
         print("❌ No data fetched")
@@ -77,14 +102,12 @@ def test_date_range():
     return df
 
 
-def test_specific_months():
+def test_specific_months(fetcher: OCCDailyDataFetcher):
     """Test fetching specific months that should have data."""
     print("\n" + "=" * 60)
     print("TEST 3: Specific Months")
     print("=" * 60)
     
-    fetcher = OCCDailyDataFetcher(download_dir="data/raw/occ_test")
-    
     # Test specific months
     test_ranges = [
         (date(2024, 1, 1), date(2024, 1, 31), "January 2024"),
@@ -92,9 +115,34 @@ def test_specific_months():
         (date(2023, 12, 1), date(2023, 12, 31), "December 2023"),
     ]
     
+    # The ranges are independent; fetch them in parallel. A Chrome driver
+    # can't be shared across threads, so each range gets its own fetcher
+    # (and browser), all writing to the same directory as the shared one.
+    # chromedriver is resolved once here so workers don't race installing it
+    driver_path = fetcher.resolve_driver_path()
+    
+    def fetch_range(start_date: date, end_date: date) -> pd.DataFrame:
+        range_fetcher = OCCDailyDataFetcher(download_dir=fetcher.download_dir, driver_path=driver_path)
+        return range_fetcher.fetch_data(start_date, end_date)
+    
+    # Skip months that can't have data before spending a browser on them
+    available = []
     for start_date, end_date, description in test_ranges:
+        if fetcher.month_available(start_date.year, start_date.month):
+            available.append((start_date, end_date, description))
+        else:
+            print(f"\n  ⏭️ {description}: outside OCC history, skipped")
+    
+    if not available:
+        return
+    
+    with ThreadPoolExecutor(max_workers=min(MAX_BROWSERS, len(available))) as executor:
+        futures = [(description, executor.submit(fetch_range, start_date, end_date))
+                   for start_date, end_date, description in available]
+    
+    for description, future in futures:
         print(f"\nTesting {description}...")
-        df = fetcher.fetch_data(start_date, end_date)
+        df = future.result()
         
         if not df.empty:
             print(f"  ✅ {description}: {len(df)} records")
@@ -102,33 +150,60 @@ def test_specific_months():
             print(f"  ❌ {description}: No data")
 
 
-def test_data_quality():
-    """Test data quality and format."""
+def test_available_months(fetcher: OCCDailyDataFetcher):
+    """Probe which months return data, extracting them concurrently."""
     print("\n" + "=" * 60)
-    print("TEST 4: Data Quality Check")
+    print("TEST 4: Available Months")
     print("=" * 60)
     
-    fetcher = OCCDailyDataFetcher(download_dir="data/raw/occ_test")
+    test_months = [
+        (2008, 1, "January 2008"),
+        (2012, 6, "June 2012"),
+        (2016, 3, "March 2016"),
+        (2020, 3, "March 2020"),
+        (2022, 9, "September 2022"),
+        (2023, 12, "December 2023"),
+        (2024, 6, "June 2024"),
+    ]
+    
+    # Months are independent, so probe them concurrently on a few pooled
+    # drivers (capped to stay polite to OCC); results come back in input order
+    results = asyncio.run(fetcher.extract_months_async(
+        [(year, month) for year, month, _ in test_months],
+        max_concurrency=min(MAX_BROWSERS, len(test_months))
+    ))
+    
+    for (year, month, description), month_data in zip(test_months, results):
+        if month_data:
+            print(f"  ✅ {description}: available")
+        else:
+            print(f"  ❌ {description}: No data")
+
+
+def test_data_quality(fetcher: OCCDailyDataFetcher):
+    """Test data quality and format."""
+    print("\n" + "=" * 60)
+    print("TEST 5: Data Quality Check")
+    print("=" * 60)
     
     # Fetch recent month
-    end_date = datetime.now().date()
+    end_date = TODAY
     start_date = end_date - relativedelta(months=1)
     
-    df = fetcher.fetch_data(start_date, end_date)
+    df = fetcher.fetch_data(start_date, end_date, columns=['date', 'symbol', 'metric', 'value'])
     
     if not df.empty:
         print("Data structure:")
         print(f"  Columns: {list(df.columns)}")
         print(f"  Shape: {df.shape}")
-        print(f"  Symbol values: {df['symbol'].unique()}")
-        print(f"  Metric types: {df['metric'].unique()}")
+        print(f"  Symbol values: {list(df['symbol'].cat.categories)}")
+        print(f"  Metric types: {list(df['metric'].cat.categories)}")
         
         # Check for nulls
-        null_counts = df.isnull().sum()
+        null_counts = df.isna().sum()
         print("\nNull values:")
-        for col, count in null_counts.items():
-            if count > 0:
-                print(f"  {col}: {count} ({count/len(df)*100:.1f}%)")
+        for col, count in null_counts[null_counts > 0].items():
+            print(f"  {col}: {count} ({count/len(df)*100:.1f}%)")
         
         # Check date format
         print("\nDate format check:")
@@ -138,9 +213,13 @@ def test_data_quality():
         
         # Value statistics
         print("\nValue statistics:")
-        print(f"  Min: {df['value'].min():,.0f}")
-        print(f"  Max: {df['value'].max():,.0f}")
-        print(f"  Mean: {df['value'].mean():,.0f}")
+        if pd.api.types.is_numeric_dtype(df['value']):
+            stats = df['value'].agg(['min', 'max', 'mean'])
+            print(f"  Min: {stats['min']:,.0f}")
+            print(f"  Max: {stats['max']:,.0f}")
+            print(f"  Mean: {stats['mean']:,.0f}")
+        else:
+            print(f"  ⚠️ value column is {df['value'].dtype}, expected numeric")
         
         return True
     else:
@@ -153,23 +232,34 @@ def main():
     print("🚀 OCC Data Fetcher Test Suite")
     print("=" * 60)
     
-    # Run tests
-    test_single_month()
-    test_date_range()
-    test_specific_months()
-    test_data_quality()
+    # Run tests against one browser session instead of starting Chrome per month
+    fetcher = OCCDailyDataFetcher(download_dir=str(TEST_DIR))
+    test_convert_without_daily_rows(fetcher)
+    
+    fetcher.start_driver()
+    try:
+        test_single_month(fetcher)
+        test_date_range(fetcher)
+        test_specific_months(fetcher)
+        test_available_months(fetcher)
+        test_data_quality(fetcher)
+    finally:
+        fetcher.close_driver()
     
     print("\n" + "=" * 60)
     print("✅ All tests completed!")
     
-    # Check output files
-    test_dir = Path("data/raw/occ_test")
-    if test_dir.exists():
-        files = list(test_dir.glob("*.parquet"))
+    # Check output files (one scandir pass; DirEntry caches stat results)
+    snapshot_dir = Path(fetcher.snapshot_dir)
+    if snapshot_dir.exists():
+        with os.scandir(snapshot_dir) as entries:
+            files = [e for e in entries if e.is_file() and e.name.endswith(".parquet")]
         print(f"\n📁 Output files created: {len(files)}")
         for f in files:
-            size_mb = f.stat().st_size / (1024 * 1024)
-            print(f"  {f.name}: {size_mb:.2f} MB")
+            size_mb = f.stat().st_size * BYTES_TO_MB
+            # Row count comes from the parquet footer; no need to read the data
+            num_rows = pq.ParquetFile(f.path).metadata.num_rows
+            print(f"  {f.name}: {size_mb:.2f} MB, {num_rows:,} rows")
 
 
 if __name__ == "__main__":
@@ -2,14 +2,18 @@
 Enhanced debug script for S&P 500 fetcher with VPN-like approaches
 """
 
+import atexit
+import functools
 import logging
 import requests
 import time
 import random
+import shutil
 from pathlib import Path
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from src.fetchers.fetch_sp500 import SP500Fetcher
@@ -18,6 +22,30 @@ from src.utils.web_scraping_utils import WebScrapingUtils
 # Set up logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
+# One pooled session shared by every HTTP probe so the TCP/TLS connection to
+# spglobal.com is reused instead of renegotiated for each request
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=20,
+    max_retries=Retry(total=2, backoff_factor=0.3)
+))
+
+DOWNLOAD_DIR = Path("data/raw/sp500")
+
+
+@functools.lru_cache(maxsize=1)
+def _shared_scraper() -> WebScrapingUtils:
+    """Start one stealth Chrome on first use and share it across Selenium tests."""
+    DOWNLOAD_DIR.mkdir(parents=True, exist_ok=True)
+    scraper = WebScrapingUtils.create_driver_with_defaults(
+        download_dir=str(DOWNLOAD_DIR),
+        headless=True,
+        apply_stealth=True
+    )
+    atexit.register(scraper.cleanup_driver)
+    return scraper
+
 def get_random_user_agent():
     """Get a random realistic user agent"""
     user_agents = [
@@ -29,18 +57,22 @@ def get_random_user_agent():
     ]
     return random.choice(user_agents)
 
+# Pick the user agent once for the session's lifetime; switching it between
+# requests that share cookies looks like bot traffic
+_SESSION.headers['User-Agent'] = get_random_user_agent()
+
 def test_session_based_download():
     """Test session-based download with better session management"""
     print("🔍 Testing session-based download with enhanced session management...")
     
     url = "https://www.spglobal.com/spdji/en/documents/additional-material/sp-500-eps-est.xlsx"
     
-    # Create a session to maintain cookies
-    session = requests.Session()
+    # Reuse the shared session to maintain cookies and pooled connections;
+    # headers are passed per request so they don't leak into other probes
+    session = _SESSION
     
     # Set realistic headers
-    session.headers.update({
-        'User-Agent': get_random_user_agent(),
+    headers = {
         'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
         'Accept-Language': 'en-US,en;q=0.5',
         'Accept-Encoding': 'gzip, deflate, br',
@@ -50,14 +82,14 @@ def test_session_based_download():
         'Sec-Fetch-Mode': 'navigate',
         'Sec-Fetch-Site': 'none',
         'Cache-Control': 'max-age=0'
-    })
+    }
     
     try:
         # First, visit the referer page to establish session
         referer_url = "https://www.spglobal.com/spdji/en/indices/equity/sp-500/"
         print(f"🌐 Visiting referer page: {referer_url}")
         
-        referer_response = session.get(referer_url, timeout=30)
+        referer_response = session.get(referer_url, headers=headers, timeout=30)
         print(f"📊 Referer response status: {referer_response.status_code}")
         
         if referer_response.status_code == 200:
@@ -70,12 +102,14 @@ def test_session_based_download():
         print(f"📥 Attempting download from: {url}")
         
         # Update headers for file download
-        session.headers.update({
+        headers.update({
             'Accept': 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet,application/vnd.ms-excel,*/*',
             'Referer': referer_url,
+            # xlsx is already zip-compressed; don't spend time on gzip decoding
+            'Accept-Encoding': 'identity',
         })
         
-        response = session.get(url, timeout=30, stream=True)
+        response = session.get(url, headers=headers, timeout=30, stream=True)
         
         print(f"📊 Download response status: {response.status_code}")
         print(f"📊 Response headers: {dict(response.headers)}")
@@ -86,9 +120,10 @@ def test_session_based_download():
             download_dir.mkdir(parents=True, exist_ok=True)
             
             file_path = download_dir / "sp-500-eps-est.xlsx"
+            # Copy the raw stream in 1 MiB blocks instead of 8 KiB Python iterations
+            response.raw.decode_content = True
             with open(file_path, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    f.write(chunk)
+                shutil.copyfileobj(response.raw, f, length=1024 * 1024)
             
             print(f"✅ File downloaded successfully: {file_path}")
             print(f"📊 File size: {file_path.stat().st_size} bytes")
@@ -106,23 +141,18 @@ def test_enhanced_selenium_with_stealth():
     """Test Selenium with enhanced stealth and VPN-like approaches"""
     print("🔍 Testing enhanced Selenium with stealth settings...")
     
-    download_dir = Path("data/raw/sp500")
+    download_dir = DOWNLOAD_DIR
     download_dir.mkdir(parents=True, exist_ok=True)
     
     # Clear any existing files
     for file in download_dir.glob("*.xlsx"):
         file.unlink()
     
-    scraper = None
     try:
-        # Use the existing WebScrapingUtils with stealth
-        scraper = WebScrapingUtils.create_driver_with_defaults(
-            download_dir=str(download_dir),
-            headless=True,
-            apply_stealth=True
-        )
-        
+        # Reuse the shared stealth browser; start each test with a clean cookie jar
+        scraper = _shared_scraper()
         driver = scraper.driver
+        driver.delete_all_cookies()
         
         # Test referer page with longer wait
         referer_url = "https://www.spglobal.com/spdji/en/indices/equity/sp-500/"
@@ -142,13 +172,15 @@ def test_enhanced_selenium_with_stealth():
         
         # Try to find any download links on the page
         try:
-            links = driver.find_elements(By.TAG_NAME, "a")
-            excel_links = [link for link in links if link.get_attribute("href") and ".xlsx" in link.get_attribute("href")]
-            print(f"🔗 Found {len(excel_links)} Excel links on the page")
+            # Filter and read the links inside the browser in one round-trip
+            # instead of one get_attribute call per anchor
+            excel_count, excel_links = driver.execute_script(
+                "const links = Array.from(document.querySelectorAll(\"a[href*='.xlsx']\"));"
+                "return [links.length, links.slice(0, 3).map(a => [a.href, a.innerText.trim()])];"
+            )
+            print(f"🔗 Found {excel_count} Excel links on the page")
             
-            for i, link in enumerate(excel_links[:3]):  # Show first 3
-                href = link.get_attribute("href")
-                text = link.text.strip()
+            for i, (href, text) in enumerate(excel_links):  # Show first 3
                 print(f"   {i+1}. {text} -> {href}")
         except Exception as e:
             print(f"⚠️ Could not search for links: {e}")
@@ -187,10 +219,6 @@ def test_enhanced_selenium_with_stealth():
         import traceback
         traceback.print_exc()
         return None
-        
-    finally:
-        if scraper:
-            scraper.cleanup_driver()
 
 def test_alternative_urls():
     """Test alternative URLs that might work"""
@@ -202,17 +230,15 @@ def test_alternative_urls():
         "https://www.spglobal.com/spdji/en/indices/equity/sp-500/",
     ]
     
-    session = requests.Session()
-    session.headers.update({
-        'User-Agent': get_random_user_agent(),
+    headers = {
         'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
         'Accept-Language': 'en-US,en;q=0.5',
-    })
+    }
     
     for url in alternative_urls:
         try:
             print(f"🔗 Testing URL: {url}")
-            response = session.get(url, timeout=10)
+            response = _SESSION.get(url, headers=headers, timeout=10)
             print(f"   Status: {response.status_code}")
             
             if response.status_code == 200:
@@ -241,10 +267,11 @@ def test_sp500_fetcher():
         if not data.empty:
             print(f"✅ S&P 500 fetcher successful!")
             print(f"📊 Data shape: {data.shape}")
-            print(f"📅 Date range: {data['date'].min()} to {data['date'].max()}")
+            date_min, date_max = data['date'].agg(['min', 'max'])
+            print(f"📅 Date range: {date_min} to {date_max}")
             print(f"📈 Metrics: {data['metric'].unique().tolist()}")
             print(f"🔢 Sample data:")
-            print(data.head())
+            print(data.iloc[:5, :6].to_string(index=False, max_colwidth=30))
         else:
             print("❌ S&P 500 fetcher returned empty data")
             